@@ -0,0 +1,117 @@
+# Benchmark of condenseSeq() against the run selection it replaced
+# (seqLister <= 1.2.0), which rescanned every _gapRun to find the
+# next longest run and was therefore quadratic in the number of runs.
+#
+# The inputs are adversarial for the old loop: frame lists so irregular
+# that nearly every gap starts a new run, such as failed frames
+# scattered through a long job.
+#
+# Usage, from the top of the repo:
+#
+#     python3 benchmarks/benchCondenseSeq.py [--legacy-max-runs N]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import seqLister
+
+# The run selection loop of condenseSeq() as of seqLister 1.2.0.
+#
+def legacySelectGapRuns(gapRunList) :
+    while True :
+        runInd = len(gapRunList) - 1
+        maxSeqLen = 0
+        maxSeqLenGapSize = 0
+        i = 0
+        for run in gapRunList :
+            if not run.isCorrected :
+                if run.seqLen > maxSeqLen :
+                    runInd = i
+                    maxSeqLen = run.seqLen
+                    maxSeqLenGapSize = run.gapSize
+                elif run.seqLen == maxSeqLen and run.gapSize < maxSeqLenGapSize :
+                    runInd = i
+                    maxSeqLenGapSize = run.gapSize
+            i += 1
+
+        if runInd == len(gapRunList) - 1 :
+            break
+
+        gapRunList[runInd].isCorrected = True
+
+        if gapRunList[runInd].seqLen == 0 :
+            continue
+
+        if runInd > 0 :
+            if not gapRunList[runInd-1].isCorrected :
+                gapRunList[runInd-1].seqLen -= 1
+
+        if runInd < len(gapRunList) - 1 :
+            nextRun = gapRunList[runInd+1]
+            if not nextRun.isCorrected :
+                nextRun.seqLen -= 1
+                nextRun.startFrame += nextRun.gapSize
+
+def gapRunsOf(frameSet) :
+    return seqLister.frameSet._gapRunsFromRuns(frameSet.runs())
+
+def timeSelect(select, frameSet) :
+    gapRunList = gapRunsOf(frameSet)
+    start = time.perf_counter()
+    select(gapRunList)
+    elapsed = time.perf_counter() - start
+    return elapsed, seqLister._formatGapRuns(gapRunList, "%d")
+
+# Failed frames scattered through a job of 'n' frames.
+#
+def scatteredFailures(n, rng) :
+    return [f for f in range(1, n + 1) if rng.random() < 0.3]
+
+# Gaps drawn at random from a few sizes, so runs are short and every
+# length/gap combination is common.
+#
+def randomGaps(n, rng) :
+    frames = []
+    frame = 0
+    for i in range(n) :
+        frame += rng.choice((1, 1, 2, 2, 3, 5))
+        frames.append(frame)
+    return frames
+
+def main() :
+    parser = argparse.ArgumentParser(description="Benchmark condenseSeq() run selection.")
+    parser.add_argument("--legacy-max-runs", type=int, default=30000,
+        help="most gap runs to run the legacy selection loop on")
+    parser.add_argument("--sizes", type=int, nargs="+",
+        default=[10**4, 10**5, 5 * 10**5])
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    print("%-20s %10s %9s %12s %12s %13s %9s" % ("workload", "frames", "runs",
+        "legacy (s)", "heap (s)", "condense (s)", "speedup"))
+    for n in args.sizes :
+        for name, frames in (("scattered failures", scatteredFailures(n, rng)),
+                             ("random gaps", randomGaps(n, rng))) :
+            frameSet = seqLister.FrameSet.fromFrames(frames)
+            runCount = len(gapRunsOf(frameSet))
+
+            start = time.perf_counter()
+            seqLister.condenseSeq(frames)
+            condense = time.perf_counter() - start
+
+            heap, heapResult = timeSelect(seqLister._selectGapRuns, frameSet)
+            if runCount <= args.legacy_max_runs :
+                legacy, legacyResult = timeSelect(legacySelectGapRuns, frameSet)
+                assert legacyResult == heapResult
+                print("%-20s %10d %9d %12.4f %12.4f %13.4f %8.1fx" % (name, len(frames),
+                    runCount, legacy, heap, condense, legacy / heap))
+            else :
+                print("%-20s %10d %9d %12s %12.4f %13.4f %9s" % (name, len(frames),
+                    runCount, "skipped", heap, condense, "-"))
+
+if __name__ == "__main__" :
+    main()
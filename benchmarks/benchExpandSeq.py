@@ -0,0 +1,75 @@
+# Benchmark of expandSeq() against the list-based dedup it replaced
+# (seqLister <= 1.2.0), which tested every new frame with
+# "frameNum not in resultList" and was therefore quadratic.
+#
+# Usage, from the top of the repo:
+#
+#     python3 benchmarks/benchExpandSeq.py [--legacy-max N]
+#
+# The legacy implementation is skipped for expansions larger than
+# '--legacy-max' frames (default 20000) as it takes minutes for 10^5.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import seqLister
+
+# The frame emitting loop of expandSeq() as of seqLister 1.2.0, fed
+# from the current parser so only the dedup strategy differs.
+#
+def legacyExpandSeq(seqList) :
+    resultList = []
+    for start, end, step in seqLister._iterFrameRanges(seqList, lambda item : None) :
+        if start == end :
+            if start not in resultList :
+                resultList.append(start)
+        elif start < end :
+            frameNum = start
+            while frameNum <= end :
+                if frameNum not in resultList :
+                    resultList.append(frameNum)
+                frameNum = frameNum + step
+        else :
+            frameNum = start
+            while frameNum >= end :
+                if frameNum not in resultList :
+                    resultList.append(frameNum)
+                frameNum = frameNum - step
+    return resultList
+
+def timeIt(func, arg) :
+    start = time.perf_counter()
+    result = func(arg)
+    return time.perf_counter() - start, len(result)
+
+def workloads(n) :
+    return [
+        ("single range", ["1-%d" % n]),
+        ("overlapping halves", ["1-%d" % (n // 2 + n // 4), "%d-%d" % (n // 4, n)]),
+        ("stepped overlays", ["1-%dx2" % n, "1-%dx3" % n, "1-%d" % n]),
+    ]
+
+def main() :
+    parser = argparse.ArgumentParser(description="Benchmark expandSeq().")
+    parser.add_argument("--legacy-max", type=int, default=20000,
+        help="largest expansion to run the legacy implementation on")
+    parser.add_argument("--sizes", type=int, nargs="+",
+        default=[10**4, 10**5, 10**6, 10**7])
+    args = parser.parse_args()
+
+    print("%-20s %10s %12s %12s %9s" % ("workload", "frames", "legacy (s)", "current (s)", "speedup"))
+    for n in args.sizes :
+        for name, seqList in workloads(n) :
+            current, count = timeIt(seqLister.expandSeq, seqList)
+            if count <= args.legacy_max :
+                legacy, legacyCount = timeIt(legacyExpandSeq, seqList)
+                assert legacyCount == count
+                print("%-20s %10d %12.4f %12.4f %8.1fx" % (name, count, legacy, current, legacy / current))
+            else :
+                print("%-20s %10d %12s %12.4f %9s" % (name, count, "skipped", current, "-"))
+
+if __name__ == "__main__" :
+    main()
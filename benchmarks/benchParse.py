@@ -0,0 +1,137 @@
+# Micro-benchmark of the single-pass regular expression parser used
+# by expandSeq() and friends against the split-chain parser it
+# replaced, which ran replace(), split("-"), split("x") and isdigit()
+# on every token, and against the C parser of the optional speedups
+# when they are built.
+#
+# Usage, from the top of the repo:
+#
+#     python3 benchmarks/benchParse.py [--repeat N]
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import seqLister
+
+# The split-chain token parser as of seqLister 1.2.0 (with the step
+# leak and zero-step fixes), which allocates a string or list at
+# nearly every step.
+#
+def legacyParseFrameRange(token) :
+
+    stepValue = 1
+
+    # No stepping by negative numbers - step back by reversing start/end
+    # This next step is equivalent to taking the absolute value of "x"
+    #
+    token = token.replace("x-", "x")
+
+    seqItemList = token.split("-") # might be range or neg number.
+
+    if "x" in seqItemList[-1] :
+        lastItem = seqItemList[-1].split("x")
+        if len(lastItem) != 2 :
+            return None
+        if not lastItem[1].isdigit() :
+            return None
+        stepValue = int(lastItem[1])
+        seqItemList[-1] = lastItem[0] # Stick last element back in the list w/o "xN" part
+
+    if seqItemList[0] == "" : # Means there was leading minus sign.
+        seqItemList.pop(0)
+        if len(seqItemList) == 0:
+            return None
+        if not seqItemList[0].isdigit() :
+            return None
+        seqItemList[0] = -1 * int(seqItemList[0]) # Repace first entry...
+    elif seqItemList[0].isdigit() :
+        seqItemList[0] = int(seqItemList[0]) #...with an integer.
+    else :
+        return None
+
+    if len(seqItemList) == 1 : # Was just string with one number in it.
+        return (seqItemList[0], seqItemList[0], 1)
+
+    if seqItemList[1] == "" : # Same as above for next entry.
+        seqItemList.pop(1)
+        if len(seqItemList) == 1:
+            return None
+        if not seqItemList[1].isdigit() :
+            return None
+        seqItemList[1] = -1 * int(seqItemList[1])
+    elif seqItemList[1].isdigit() :
+        seqItemList[1] = int(seqItemList[1])
+    else :
+        return None
+
+    # Should only be exactly two entries at this point.
+    if len(seqItemList) != 2 :
+        return None
+
+    # Ummm - dumb but why not? list from n to n, i.e., one number.
+    if seqItemList[0] == seqItemList[1] :
+        return (seqItemList[0], seqItemList[0], 1)
+
+    # Stepping by zero would never reach the end of the range.
+    if stepValue == 0 :
+        return None
+
+    return (seqItemList[0], seqItemList[1], stepValue)
+
+def legacyParseSeqString(seqItem) :
+    return tuple([legacyParseFrameRange(token) for token in seqItem.replace(",", " ").split()])
+
+specs = [
+    ("single frame", "1001"),
+    ("range", "1001-1240"),
+    ("stepped range", "1001-1240x10"),
+    ("negative range", "-20--5x-3"),
+    ("invalid", "1-6x2-"),
+    ("20 tokens", ", ".join("%d-%dx2" % (n, n + 9) for n in range(1001, 1201, 10))),
+]
+
+# pythonParseSeqString() - The regular expression parser on its own,
+# without handing off to the C speedups.
+#
+def pythonParseSeqString(spec) :
+    speedups = seqLister._speedups
+    seqLister._speedups = None
+    try :
+        return seqLister._parseSeqStringUncached(spec)
+    finally :
+        seqLister._speedups = speedups
+
+def main() :
+    parser = argparse.ArgumentParser(description="Benchmark Frame-Range parsing.")
+    parser.add_argument("--repeat", type=int, default=100000)
+    args = parser.parse_args()
+
+    speedups = seqLister._speedups
+    header = "%-16s %8s %14s %14s %9s" % ("spec", "tokens", "legacy (ns)", "regex (ns)", "speedup")
+    if speedups is not None :
+        header += " %14s %9s" % ("C (ns)", "speedup")
+    print(header)
+
+    for name, spec in specs :
+        assert legacyParseSeqString(spec) == pythonParseSeqString(spec)
+        tokens = len(spec.replace(",", " ").split())
+        legacy = min(timeit.repeat(lambda : legacyParseSeqString(spec), number=args.repeat, repeat=3))
+        seqLister._speedups = None
+        try :
+            regex = min(timeit.repeat(lambda : seqLister._parseSeqStringUncached(spec),
+                number=args.repeat, repeat=3))
+        finally :
+            seqLister._speedups = speedups
+        line = "%-16s %8d %14.0f %14.0f %8.1fx" % (name, tokens,
+            legacy / args.repeat / tokens * 1e9, regex / args.repeat / tokens * 1e9, legacy / regex)
+        if speedups is not None :
+            assert speedups.parseSeqString(spec) == pythonParseSeqString(spec)
+            fast = min(timeit.repeat(lambda : speedups.parseSeqString(spec), number=args.repeat, repeat=3))
+            line += " %14.0f %8.1fx" % (fast / args.repeat / tokens * 1e9, legacy / fast)
+        print(line)
+
+if __name__ == "__main__" :
+    main()
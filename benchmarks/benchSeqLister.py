@@ -0,0 +1,174 @@
+# Benchmark suite for the hot paths of seqLister: expandSeq(),
+# condenseSeq(), condenseSeqOnes() and the expand/condense round trip,
+# over a handful of workload shapes seen on the farm.
+#
+# Results may be saved as JSON with --save, and a later run (say with
+# a newer release of seqLister on the path) compared against them with
+# --compare, which flags anything slower than --threshold.
+#
+# Usage, from the top of the repo:
+#
+#     python3 benchmarks/benchSeqLister.py [--quick] [--save FILE] [--compare FILE]
+#
+# To benchmark an installed release instead of the tree, use --installed.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+# Each workload returns either a list of Frame-Range strings or a list
+# of frames, and is converted to the other for the functions that take
+# it (see runSuite()).
+
+# A few long runs of successive frames.
+#
+def denseRanges(n, rng) :
+    quarter = n // 4
+    return ["%d-%d" % (i * quarter + 1, (i + 1) * quarter - 10) for i in range(4)]
+
+# Frames picked at random, a third of them, from a job of 'n' frames.
+#
+def sparseRandom(n, rng) :
+    return [f for f in range(1, n + 1) if rng.random() < 0.33]
+
+# The prime-step overlay from the README, scaled up to 'n' frames.
+#
+def primeStepOverlay(n, rng) :
+    return ["%d-%dx%d" % (p, n, p) for p in (2, 3, 5, 7, 11, 13, 17, 19, 23)]
+
+# A large range of negative frames counting down, with a stepped
+# overlay.
+#
+def hugeNegative(n, rng) :
+    return ["-1--%d" % n, "-%d--1x-3" % n]
+
+# Lots of short comma separated strings, as in per-shot job specs.
+#
+def manySmallStrings(n, rng) :
+    seqList = []
+    frame = 1
+    while frame < n :
+        seqList.append("%d-%d, %d, %d-%dx2" % (frame, frame + 5, frame + 8,
+            frame + 10, frame + 16))
+        frame += 20
+    return seqList
+
+WORKLOADS = [
+    ("dense ranges", denseRanges),
+    ("sparse random", sparseRandom),
+    ("prime-step overlay", primeStepOverlay),
+    ("huge negative", hugeNegative),
+    ("many small strings", manySmallStrings),
+]
+
+def timeIt(func, repeat) :
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    times = [elapsed / number]
+    for i in range(repeat - 1) :
+        times.append(timer.timeit(number) / number)
+    return min(times)
+
+def runSuite(seqLister, n, repeat) :
+    results = {}
+    rng = random.Random(1)
+    for name, workload in WORKLOADS :
+        seqList = workload(n, rng)
+        if all(isinstance(item, int) for item in seqList) :
+            frames = seqList
+            seqList = seqLister.condenseSeq(frames)
+        else :
+            frames = seqLister.expandSeq(seqList)
+        strFrames = [str(f) for f in frames]
+
+        results[name] = {
+            "frames" : len(frames),
+            "expandSeq" : timeIt(lambda : seqLister.expandSeq(seqList), repeat),
+            "condenseSeq" : timeIt(lambda : seqLister.condenseSeq(frames), repeat),
+            "condenseSeqOnes" : timeIt(lambda : seqLister.condenseSeqOnes(frames), repeat),
+            "condenseSeq (str)" : timeIt(lambda : seqLister.condenseSeq(strFrames), repeat),
+            "round trip" : timeIt(lambda :
+                seqLister.condenseSeq(seqLister.expandSeq(seqList)), repeat),
+        }
+    return results
+
+def printResults(results, baseline, threshold) :
+    regressions = 0
+    print("%-20s %-18s %9s %12s %12s %8s" % ("workload", "function", "frames",
+        "time (ms)", "baseline", "ratio"))
+    for name, timings in results.items() :
+        for func, seconds in timings.items() :
+            if func == "frames" :
+                continue
+            line = "%-20s %-18s %9d %12.3f" % (name, func, timings["frames"], seconds * 1000)
+            base = baseline.get(name, {}).get(func) if baseline else None
+            if base :
+                ratio = seconds / base
+                line += " %12.3f %7.2fx" % (base * 1000, ratio)
+                if ratio > 1 + threshold :
+                    line += "  SLOWER"
+                    regressions += 1
+            print(line)
+    return regressions
+
+def main() :
+    parser = argparse.ArgumentParser(description="Benchmark seqLister's hot paths.")
+    parser.add_argument("--frames", type=int, default=100000,
+        help="size of each workload in frames")
+    parser.add_argument("--repeat", type=int, default=5,
+        help="timings taken of each benchmark, the best is kept")
+    parser.add_argument("--quick", action="store_true",
+        help="small workloads and few repeats, to check the suite runs")
+    parser.add_argument("--save", metavar="FILE",
+        help="save the results as JSON to FILE")
+    parser.add_argument("--compare", metavar="FILE",
+        help="compare the results against those saved in FILE")
+    parser.add_argument("--threshold", type=float, default=0.1,
+        help="flag results this fraction slower than the baseline (default 0.1)")
+    parser.add_argument("--installed", action="store_true",
+        help="benchmark the installed seqLister rather than the one in this tree")
+    args = parser.parse_args()
+
+    if not args.installed :
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+    import seqLister
+
+    if args.quick :
+        args.frames = 2000
+        args.repeat = 1
+
+    baseline = None
+    if args.compare :
+        with open(args.compare) as f :
+            saved = json.load(f)
+        print("baseline: seqLister %s, python %s, %d frames" % (saved["version"],
+            saved["python"], saved["frames"]))
+        baseline = saved["results"]
+
+    print("seqLister %s, python %s, %d frames" % (seqLister.__version__,
+        platform.python_version(), args.frames))
+    results = runSuite(seqLister, args.frames, args.repeat)
+    regressions = printResults(results, baseline, args.threshold)
+
+    if args.save :
+        with open(args.save, "w") as f :
+            json.dump({
+                "version" : seqLister.__version__,
+                "python" : platform.python_version(),
+                "machine" : platform.machine(),
+                "frames" : args.frames,
+                "results" : results,
+            }, f, indent=4)
+            f.write("\n")
+
+    if regressions :
+        print("%d benchmark(s) slower than the baseline" % regressions)
+        return 1
+    return 0
+
+if __name__ == "__main__" :
+    sys.exit(main())
@@ -1,3 +1,7 @@
-from setuptools import setup
+from setuptools import setup, Extension
 if __name__ == '__main__':
-    setup()
+    setup(
+        # The C speedups are optional: if they fail to build, seqLister
+        # still installs and uses its pure python code.
+        ext_modules=[Extension("seqLister._speedups", ["src/seqLister/_speedups.c"], optional=True)],
+    )
@@ -82,6 +82,27 @@
 #
 __version__ = "1.2.0"
 
+import bisect
+import contextvars
+import functools
+import heapq
+import itertools
+import operator
+import os
+import time
+
+# The optional C versions of the kernels below (see _speedups.c), used
+# when the extension has been built, unless SEQLISTER_NO_SPEEDUPS is set
+# in the environment. The python code is the reference implementation,
+# and is used for anything the C code hands back None for.
+#
+try :
+    if os.environ.get("SEQLISTER_NO_SPEEDUPS") :
+        raise ImportError("turned off by SEQLISTER_NO_SPEEDUPS")
+    from . import _speedups
+except ImportError :
+    _speedups = None
+
 # expandSeq() - Expands the argument 'seqList' into a list of integers.
 #
 # 'seqList' may be a single string or int, or a list of ints
@@ -118,137 +139,653 @@ __version__ = "1.2.0"
 #
 # Anything that is not of the above format is ignored for
 # the purposes of building the list of integers and the ignored
-# item is appended to the optional argument "nonSeqList".
+# item is appended to the optional list "nonSeqList".
 #
-# The returned list of integers is NOT sorted.
+# The returned list of integers is NOT sorted, unless 'order' is
+# "sorted" (rather than the default "listed"), in which case the
+# frames are returned in increasing order, which is quicker than
+# sorting the listed order afterwards. For example:
+#     expandSeq(["0-16x8", "0-16x2"], order="sorted")
+#         returns -> [0, 2, 4, 6, 8, 10, 12, 14, 16]
 #
 # New as of v1.2.0: Strings containing whitespace (and/or commas)
 # will be split into multiple list entries, and processed as
 # described above.
 #
-def expandSeq(seqList, nonSeqList=[]) :
+def expandSeq(seqList, nonSeqList=None, order="listed") :
 
-    nonSeqList.clear()
+    if order == "listed" :
+        expandRanges = _expandRanges
+    elif order == "sorted" :
+        expandRanges = _expandRangesSorted
+    else :
+        raise ValueError("order must be \"listed\" or \"sorted\", not " + repr(order))
+
+    scoped = _scopedStats.get()
+    stats = _activeStats if scoped is None else scoped[0]
+    if stats is not None :
+        return _expandSeqStats(seqList, _rejecter(nonSeqList), stats, expandRanges)
+
+    return expandRanges(_iterFrameRanges(seqList, _rejecter(nonSeqList)))
+
+# _expandSeqStats() - expandSeq() while collecting SeqStats.
+#
+def _expandSeqStats(seqList, reject, stats, expandRanges) :
+    startTime = time.perf_counter()
+    frameRanges = list(_iterFrameRanges(seqList, reject))
+    parsedTime = time.perf_counter()
+    frames = expandRanges(frameRanges)
+    stats.expandSeconds += time.perf_counter() - parsedTime
+    stats.parseSeconds += parsedTime - startTime
+
+    stats.expandCalls += 1
+    stats.tokensParsed += len(frameRanges)
+    stats.framesGenerated += len(frames)
+    stats.duplicatesDropped += sum([len(_frameRange(start, end, step))
+        for start, end, step in frameRanges]) - len(frames)
+    return frames
+
+# The regular expression for one whitespace or comma separated token of
+# a string of Frame-Ranges, matched in a single pass over the string.
+# Either the token is a Frame-Range:
+#
+#     'A', 'A-B' or 'A-BxN'
+#
+# where A and B may be negative, an optional "xN" on a single number is
+# ignored, and 'x-N' is the same as 'xN' (there's no stepping by
+# negative numbers - step back by reversing start/end). Or else the
+# whole token is matched as something that isn't a Frame-Range.
+#
+# It is compiled by _compileFrameRangeRE() the first time a string is
+# parsed in python, rather than when seqLister is imported, as importing
+# the re module alone takes longer than the rest of "import seqLister".
+# Use it as (_frameRangeRE or _compileFrameRangeRE()).
+#
+_frameRangeRE = None
+
+def _compileFrameRangeRE() :
+    global _frameRangeRE
+    import re
+    _frameRangeRE = re.compile(r"""
+        (-?\d+)                 # A
+        (?: - (-?\d+) )?        # -B
+        (?: x-? (\d+) )?        # xN
+        (?! [^\s,] )            # ...up to the end of the token,
+        | ( [^\s,]+ )           # otherwise not a Frame-Range.
+    """, re.VERBOSE)
+    return _frameRangeRE
+
+# _frameRangeFromGroups() - Returns the (start, end, step) tuple for
+# the groups of a match of _frameRangeRE (as returned by findall(), so
+# with '' for groups that didn't match), where 'step' is always
+# positive, and 'start > end' means the range counts down. Returns
+# None if the matched token isn't a Frame-Range.
+#
+def _frameRangeFromGroups(start, end, step, bad) :
+    if bad :
+        return None
+    start = int(start)
+    if not end :
+        return (start, start, 1)
+    end = int(end)
+    if start == end : # Ummm - dumb but why not? list from n to n, i.e., one number.
+        return (start, start, 1)
+    if not step :
+        return (start, end, 1)
+    step = int(step)
+    if step == 0 : # Stepping by zero would never reach the end of the range.
+        return None
+    return (start, end, step)
+
+# _parseFrameRange() - Parses a single Frame-Range token (no
+# whitespace or commas) and returns its (start, end, step) tuple, as
+# above, or None if 'token' isn't a Frame-Range.
+#
+def _parseFrameRange(token) :
+    match = (_frameRangeRE or _compileFrameRangeRE()).fullmatch(token)
+    if match is None :
+        return None
+    return _frameRangeFromGroups(*match.groups(""))
+
+# _iterFrameRanges() - Walks 'seqList' (as passed to expandSeq()) and
+# yields the (start, end, step) tuple of every Frame-Range found in
+# it, in order. Ints are yielded as (n, n, 1). Anything that is not
+# a Frame-Range is handed to 'reject()' instead.
+#
+def _iterFrameRanges(seqList, reject) :
 
     if not isinstance(seqList, list) :
-        tmp=seqList
-        seqList = [tmp]
+        seqList = [seqList]
 
-    resultList = []
     for seqItem in seqList :
-        origItem = seqItem
-        if not (isinstance(seqItem, int) or isinstance(seqItem, str)) :
+        if isinstance(seqItem, int) :
+            yield (seqItem, seqItem, 1)
+            continue
+
+        if not isinstance(seqItem, str) :
             # Discard item and continue to next one
-            nonSeqList.append(origItem)
+            reject(seqItem)
             continue
 
+        for frameRange in _parseSeqString(seqItem) :
+            if frameRange is None :
+                reject(seqItem)
+            else :
+                yield frameRange
+
+# _parseSeqStringUncached() - Parses a string of Frame-Ranges and
+# returns a tuple with the (start, end, step) tuple of each one, in
+# order, or None in place of each token that isn't a Frame-Range.
+#
+# Tokens may be separated by any mix of whitespace and commas, which
+# allows, for a looser interpretation of what can be in passed to us
+# via seqList. For example these lists are treated the same:
+#    ['1', '2', '3', '4'] == ['1 2,3', '4']
+#
+def _parseSeqStringUncached(seqItem) :
+    if _speedups is not None :
+        frameRanges = _speedups.parseSeqString(seqItem)
+        if frameRanges is not None :
+            return frameRanges
+    return tuple([_frameRangeFromGroups(start, end, step, bad)
+        for start, end, step, bad in (_frameRangeRE or _compileFrameRangeRE()).findall(seqItem)])
+
+# SeqParseError - Raised by parseSeq() for the first item that isn't
+# a Frame-Range. Its 'item' attribute is the offending item of
+# 'seqList', and for strings 'token' is the bad token within it and
+# 'pos' is the index at which it starts.
+#
+class SeqParseError(ValueError) :
+    def __init__(self, item, token=None, pos=None) :
+        self.item = item
+        self.token = token
+        self.pos = pos
+        if token is None :
+            message = "not a Frame-Range: " + repr(item)
+        else :
+            message = "not a Frame-Range: " + repr(token) + \
+                " at position " + str(pos) + " of " + repr(item)
+        ValueError.__init__(self, message)
+
+# parseSeq() - Parses 'seqList', anything expandSeq() accepts, and
+# returns the list of (start, end, step) tuples of its Frame-Ranges,
+# in order, without expanding them. 'step' is always positive, and
+# 'start > end' means the range counts down. Unlike expandSeq(),
+# anything that isn't a Frame-Range raises a SeqParseError saying
+# exactly where it is. For example:
+#
+#     parseSeq("1-10, 20-10x-5 7")
+#         returns -> [(1, 10, 1), (20, 10, 5), (7, 7, 1)]
+#
+#     parseSeq("1-10 1-6x2- 7")
+#         raises -> SeqParseError: not a Frame-Range: '1-6x2-' at position 5 of '1-10 1-6x2- 7'
+#
+def parseSeq(seqList) :
+
+    if not isinstance(seqList, list) :
+        seqList = [seqList]
+
+    frameRanges = []
+    for seqItem in seqList :
         if isinstance(seqItem, int) :
-            if seqItem not in resultList :
-                resultList.append(seqItem)
+            frameRanges.append((seqItem, seqItem, 1))
+        elif isinstance(seqItem, str) :
+            for match in (_frameRangeRE or _compileFrameRangeRE()).finditer(seqItem) :
+                frameRange = _frameRangeFromGroups(*match.groups(""))
+                if frameRange is None :
+                    raise SeqParseError(seqItem, match.group(), match.start())
+                frameRanges.append(frameRange)
+        else :
+            raise SeqParseError(seqItem)
+    return frameRanges
+
+# The parse cache. Job specs tend to use the same few Frame-Range
+# strings over and over, so parsed strings are kept in a bounded LRU
+# cache keyed by the raw string. See setParseCacheSize() below.
+#
+_parseCacheSize = 1024
+_parseSeqString = functools.lru_cache(maxsize=_parseCacheSize)(_parseSeqStringUncached)
+
+# parseCacheInfo() - Returns the statistics of the cache of parsed
+# Frame-Range strings used by expandSeq() and friends, as the named
+# tuple (hits, misses, maxsize, currsize).
+#
+def parseCacheInfo() :
+    return _parseSeqString.cache_info()
+
+# clearParseCache() - Empties the cache of parsed Frame-Range strings
+# and resets its statistics.
+#
+def clearParseCache() :
+    _parseSeqString.cache_clear()
+
+# setParseCacheSize() - Sets the number of Frame-Range strings kept in
+# the parse cache (1024 by default). Zero turns the cache off and None
+# lets it grow without bound. Empties the cache.
+#
+def setParseCacheSize(maxsize) :
+    global _parseCacheSize, _parseSeqString
+    _parseCacheSize = maxsize
+    _parseSeqString = functools.lru_cache(maxsize=maxsize)(_parseSeqStringUncached)
+
+# _frameRange() - Returns the python range() of the frames described
+# by one (start, end, step) tuple, in the order they are listed.
+#
+def _frameRange(start, end, step) :
+    if start <= end :
+        return range(start, end + 1, step)
+    else :
+        return range(start, end - 1, -step)
+
+# _expandRanges() - The expansion engine behind expandSeq(). Takes an
+# iterable of (start, end, step) tuples and returns the list of
+# frames they describe in first-seen order with no frame repeated.
+#
+# The cost is linear in the number of frames returned. Ranges that
+# don't overlap anything listed before them are appended in bulk and
+# only remembered as ranges (kept sorted in 'runs' so that overlaps
+# can be found with a binary search). Once a range overlaps earlier
+# frames, the ranges it touches are moved into the 'seen' set and
+# the new range is filtered frame by frame against that set.
+#
+def _expandRanges(frameRanges) :
+
+    if _speedups is not None :
+        frameRanges = list(frameRanges)
+        resultList = _speedups.expandRanges(frameRanges)
+        if resultList is not None :
+            return resultList
+
+    resultList = []
+
+    runs = []       # Bulk-appended ranges with disjoint spans, sorted...
+    runStarts = []  # ...with their lowest...
+    runEnds = []    # ...and highest frames.
+
+    seen = set()    # Every other frame listed so far...
+    seenLo = None   # ...and the bounds of those frames.
+    seenHi = None
+
+    for start, end, step in frameRanges :
+
+        if start == end : # Single frame.
+            i = bisect.bisect_right(runStarts, start)
+            if i > 0 and start <= runEnds[i-1] and start in runs[i-1] :
+                continue
+            if start in seen :
+                continue
+            seen.add(start)
+            resultList.append(start)
+            if seenLo is None :
+                seenLo = seenHi = start
+            elif start < seenLo :
+                seenLo = start
+            elif start > seenHi :
+                seenHi = start
             continue
 
-        stepValue = 1
+        frames = _frameRange(start, end, step)
+        lo = min(frames[0], frames[-1])
+        hi = max(frames[0], frames[-1])
 
-        # Turn any embedded commas and tabs into spaces.
-        # Then split the seqItem into separate items if containing
-        # spaces which allows, for a looser interpretation of
-        # what can be in passed to us here via seqList.
-        #
-        # For example these lists are treated the same in this function:
-        #    ['1', '2', '3', '4'] == ['1 2,3', '4']
+        # Retire any bulk-appended ranges this one overlaps into 'seen'.
         #
-        seqItem = seqItem.replace(",", " ")
-        splitSeqItem = seqItem.split() # Treats consecutive whitespace as one separator.
-
-        for seqItem in splitSeqItem :
-
-            # No stepping by negative numbers - step back by reversing start/end
-            # This next step is equivalent to taking the absolute value of "x"
-            #
-            seqItem = seqItem.replace("x-", "x")
-
-            seqItemList = seqItem.split("-") # might be range or neg number.
-
-            if "x" in seqItemList[-1] :
-                lastItem = seqItemList[-1].split("x")
-                if len(lastItem) != 2 :
-                    nonSeqList.append(origItem)
-                    continue
-                if not lastItem[1].isdigit() :
-                    nonSeqList.append(origItem)
-                    continue
-                stepValue = int(lastItem[1])
-                seqItemList[-1] = lastItem[0] # Stick last element back in the list w/o "xN" part
-
-            if seqItemList[0] == "" : # Means there was leading minus sign.
-                seqItemList.pop(0)
-                if len(seqItemList) == 0:
-                    nonSeqList.append(origItem)
-                    continue
-                if not seqItemList[0].isdigit() :
-                    nonSeqList.append(origItem)
-                    continue
-                seqItemList[0] = -1 * int(seqItemList[0]) # Repace first entry...
-            elif seqItemList[0].isdigit() :
-                seqItemList[0] = int(seqItemList[0]) #...with an integer.
+        j = bisect.bisect_left(runEnds, lo)
+        i = bisect.bisect_right(runStarts, hi)
+        if j < i :
+            for run in runs[j:i] :
+                seen.update(run)
+            if seenLo is None :
+                seenLo = runStarts[j]
+                seenHi = runEnds[i-1]
             else :
-                nonSeqList.append(origItem)
-                continue
+                seenLo = min(seenLo, runStarts[j])
+                seenHi = max(seenHi, runEnds[i-1])
+            del runs[j:i]
+            del runStarts[j:i]
+            del runEnds[j:i]
 
-            if len(seqItemList) == 1 : # Was just string with one number in it.
-                if seqItemList[0] not in resultList :
-                    resultList.append(seqItemList[0])
-                continue
+        if seenLo is None or hi < seenLo or lo > seenHi :
+            resultList.extend(frames)
+            runs.insert(j, frames)
+            runStarts.insert(j, lo)
+            runEnds.insert(j, hi)
+            continue
 
-            if seqItemList[1] == "" : # Same as above for next entry.
-                seqItemList.pop(1)
-                if len(seqItemList) == 1:
-                    nonSeqList.append(origItem)
-                    continue
-                if not seqItemList[1].isdigit() :
-                    nonSeqList.append(origItem)
-                    continue
-                seqItemList[1] = -1 * int(seqItemList[1])
-            elif seqItemList[1].isdigit() :
-                seqItemList[1] = int(seqItemList[1])
-            else :
-                nonSeqList.append(origItem)
-                continue
+        for frameNum in frames :
+            if frameNum not in seen :
+                seen.add(frameNum)
+                resultList.append(frameNum)
+        seenLo = min(seenLo, lo)
+        seenHi = max(seenHi, hi)
 
-            # Should only be exactly two entries at this point.
-            if len(seqItemList) != 2 :
-                nonSeqList.append(origItem)
-                continue
+    return resultList
+
+# _expandRangesSorted() - The engine behind expandSeq(order="sorted").
+# Takes an iterable of (start, end, step) tuples and returns the
+# frames they describe in increasing order with no frame repeated.
+#
+# The ranges are turned to count up and sorted by their lowest frame,
+# then swept into clusters whose spans overlap. A cluster of one range
+# is expanded as it is, and a cluster whose ranges are all on ones as
+# the one range from its lowest to its highest frame, in bulk by
+# _expandRanges() since none of these overlap. Only
+# clusters with overlapping stepped ranges are expanded frame by frame
+# and sorted, which beats a k-way merge of the ranges with heapq in
+# python since the sort is on ascending stretches of frames.
+#
+def _expandRangesSorted(frameRanges) :
+
+    spans = []
+    for start, end, step in frameRanges :
+        if start > end :
+            start, end = end + (start - end) % step, start
+        else :
+            end -= (end - start) % step
+        spans.append((start, end, step))
+    spans.sort()
+
+    # The common case, where no two ranges overlap.
+    #
+    if all(map(operator.lt, [span[1] for span in spans],
+            itertools.islice([span[0] for span in spans], 1, None))) :
+        return _expandRanges(spans)
+
+    resultList = []
+    disjoint = [] # Ranges not yet expanded, none overlapping another.
 
-            # Ummm - dumb but why not? list from n to n, i.e., one number.
-            if seqItemList[0] == seqItemList[1] :
-                if seqItemList[0] not in resultList :
-                    resultList.append(seqItemList[0])
-            elif seqItemList[0] < seqItemList[1] : # Counting up.
-                frameNum = seqItemList[0]
-                while frameNum <= seqItemList[1] :
-                    if frameNum not in resultList :
-                        resultList.append(frameNum)
-                    frameNum =  frameNum + stepValue
-            else : # Counting down.
-                frameNum = seqItemList[0]
-                while frameNum >= seqItemList[1] :
-                    if frameNum not in resultList :
-                        resultList.append(frameNum)
-                    frameNum =  frameNum - stepValue
+    i = 0
+    while i < len(spans) :
+        lo, hi, step = spans[i]
+        onOnes = step == 1 or lo == hi
+        j = i + 1
+        while j < len(spans) and spans[j][0] <= hi + onOnes :
+            onOnes = onOnes and (spans[j][2] == 1 or spans[j][0] == spans[j][1])
+            hi = max(hi, spans[j][1])
+            j += 1
 
+        if onOnes :
+            disjoint.append((lo, hi, 1))
+        elif j == i + 1 :
+            disjoint.append(spans[i])
+        else :
+            resultList.extend(_expandRanges(disjoint))
+            disjoint = []
+            frames = _expandRanges(spans[i:j])
+            frames.sort()
+            resultList.extend(frames)
+        i = j
+
+    if not resultList :
+        return _expandRanges(disjoint)
+    resultList.extend(_expandRanges(disjoint))
     return resultList
 
+# iexpandSeq() - The same as expandSeq() above, except that it is a
+# generator which yields the frames one at a time, in the same order
+# and with the same "only list a number once" rule, instead of
+# building the whole list first.
+#
+# Items in 'seqList' that aren't Frame-Ranges are passed, as they
+# are found, to the optional callable 'onNonSeq'. For example:
+#
+#     badArgs = []
+#     for frame in iexpandSeq(["1-4", "a-b", "3-6"], badArgs.append) :
+#         ...
+#
+# yields 1, 2, 3, 4, 5, 6 and leaves badArgs == ['a-b'].
+#
+# Memory use is proportional to the number of Frame-Ranges in
+# 'seqList' rather than the number of frames, as the frames already
+# listed are remembered as intervals instead of individual numbers.
+#
+def iexpandSeq(seqList, onNonSeq=None) :
+
+    if onNonSeq is None :
+        onNonSeq = _ignore
+
+    for frames in _iexpandChunks(_iterFrameRanges(seqList, onNonSeq)) :
+        yield from frames
+
+# _iexpandChunks() - The generator behind iexpandSeq() and
+# expandSeqArray(). Takes an iterable of (start, end, step) tuples
+# and yields the frames of each Frame-Range in turn as iterables: the
+# range() itself when none of its frames have been listed before,
+# otherwise the sub-ranges of it that fall between the intervals
+# listed before (none at all when one of them covers it), which are
+# only filtered frame by frame when they overlap ranges with a step
+# greater than one. Each chunk must be used up before asking for the
+# next one.
+#
+def _iexpandChunks(frameRanges) :
+
+    onesStarts = [] # Sorted, disjoint, non-adjacent intervals of
+    onesEnds = []   # frames listed so far by singles and ranges on ones.
+    stepped = []    # (lo, hi, range) for ranges with a step > 1.
+
+    for start, end, step in frameRanges :
+
+        frames = _frameRange(start, end, step)
+        lo = min(frames[0], frames[-1])
+        hi = max(frames[0], frames[-1])
+
+        # Find what has been listed before that overlaps [lo, hi].
+        #
+        j = bisect.bisect_left(onesEnds, lo)
+        i = bisect.bisect_right(onesStarts, hi)
+        overlapStepped = [s[2] for s in stepped if s[0] <= hi and s[1] >= lo]
+
+        if j == i and not overlapStepped :
+            yield frames
+        elif not any(_rangeCovers(r, frames) for r in overlapStepped) :
+            for piece in _unlistedRanges(frames, onesStarts, onesEnds, j, i) :
+                if overlapStepped :
+                    yield _unlistedFrames(piece, overlapStepped)
+                else :
+                    yield piece
+
+        # Remember this range.
+        #
+        if len(frames) > 1 and frames.step not in (1, -1) :
+            stepped.append((lo, hi, frames))
+        else :
+            j = bisect.bisect_left(onesEnds, lo - 1)
+            i = bisect.bisect_right(onesStarts, hi + 1)
+            if j < i :
+                lo = min(lo, onesStarts[j])
+                hi = max(hi, onesEnds[i-1])
+            onesStarts[j:i] = [lo]
+            onesEnds[j:i] = [hi]
+
+# _rangeCovers() - Returns True when every frame of the range 'frames'
+# is in the range 'r'.
+#
+def _rangeCovers(r, frames) :
+    return frames[0] in r and (len(frames) == 1
+        or (frames[-1] in r and frames.step % r.step == 0))
+
+# _unlistedRanges() - Returns the list of the non-empty slices of the
+# range 'frames' (in its order) which lie outside the intervals
+# [starts[k], ends[k]] for j <= k < i, the ones overlapping it. Each
+# slice is worked out from the ends of the gaps between the intervals,
+# so this costs the same however many frames they cover.
+#
+def _unlistedRanges(frames, starts, ends, j, i) :
+    first = frames[0]
+    step = frames.step
+    last = first + (len(frames) - 1) * step
+    lo = min(first, last)
+    hi = max(first, last)
+
+    gaps = []
+    for k in range(j, i) :
+        if starts[k] > lo :
+            gaps.append((lo, starts[k] - 1))
+        lo = ends[k] + 1
+    if lo <= hi :
+        gaps.append((lo, hi))
+
+    pieces = []
+    if step > 0 :
+        for gapLo, gapHi in gaps :
+            piece = frames[max(0, -((first - gapLo) // step)) : (gapHi - first) // step + 1]
+            if piece :
+                pieces.append(piece)
+    else :
+        for gapLo, gapHi in reversed(gaps) :
+            piece = frames[max(0, -((first - gapHi) // step)) : (gapLo - first) // step + 1]
+            if piece :
+                pieces.append(piece)
+    return pieces
+
+# _unlistedFrames() - Yields the frames in 'frames' that aren't in one
+# of the ranges in 'overlapStepped'.
+#
+def _unlistedFrames(frames, overlapStepped) :
+    for frameNum in frames :
+        for r in overlapStepped :
+            if frameNum in r :
+                break
+        else :
+            yield frameNum
+
+# expandSeqArray() - The same as expandSeq() above, except that the
+# frames are returned in a compact array.array('q') of 64 bit ints
+# (8 bytes a frame) rather than a list of python ints, or when
+# 'asNumpy' is True in a NumPy int64 ndarray (NumPy must be installed).
+#
+# Frame-Ranges that don't overlap frames listed before them are
+# filled in bulk, without a python loop over their frames. An
+# OverflowError is raised for frames that don't fit in 64 bits.
+#
+# For example:
+#     expandSeqArray(["1-5", "3-8x2"])
+#         returns -> array('q', [1, 2, 3, 4, 5, 7])
+#
+def expandSeqArray(seqList, nonSeqList=None, asNumpy=False) :
+
+    return _expandRangesArray(_iterFrameRanges(seqList, _rejecter(nonSeqList)), asNumpy)
+
+def _expandRangesArray(frameRanges, asNumpy) :
+
+    if asNumpy :
+        import numpy
+        chunks = []
+        for frames in _iexpandChunks(frameRanges) :
+            if isinstance(frames, range) :
+                # numpy.arange() wraps around rather than raising.
+                if frames and (min(frames[0], frames[-1]) < -(1 << 63)
+                        or max(frames[0], frames[-1]) >= 1 << 63) :
+                    raise OverflowError("int too big to convert")
+                chunks.append(numpy.arange(frames.start, frames.stop, frames.step, dtype=numpy.int64))
+            else :
+                chunks.append(numpy.fromiter(frames, dtype=numpy.int64))
+        if len(chunks) == 1 :
+            return chunks[0]
+        if not chunks :
+            return numpy.zeros(0, dtype=numpy.int64)
+        return numpy.concatenate(chunks)
+
+    import array # Only imported when needed, to keep "import seqLister" cheap.
+    frameArray = array.array("q")
+    for frames in _iexpandChunks(frameRanges) :
+        frameArray.extend(frames)
+    return frameArray
+
+# compileSeq() - Parses 'seqList', anything expandSeq() accepts, once
+# and returns a CompiledSeq which can then be expanded any number of
+# times without parsing the Frame-Ranges again. Items that aren't
+# Frame-Ranges are appended to 'nonSeqList' straight away, and are
+# also kept in the CompiledSeq's 'nonSeqList' attribute. For example:
+#
+#     shotFrames = compileSeq("1001-1240x10")
+#     shotFrames.expand()
+#         returns -> [1001, 1011, 1021, ..., 1231]
+#
+def compileSeq(seqList, nonSeqList=None) :
+
+    rejects = _lazyRejects()
+    frameRanges = tuple(_iterFrameRanges(seqList, rejects.append))
+    if nonSeqList is not None :
+        nonSeqList[:] = rejects.items
+    return CompiledSeq(frameRanges, tuple(rejects.items))
+
+# CompiledSeq - A parsed list of Frame-Ranges, see compileSeq() above.
+#
+# expand(), iexpand() and expandArray(asNumpy=False) return the same
+# as expandSeq(), iexpandSeq() and expandSeqArray() would for the
+# original 'seqList', and frameSet() returns its FrameSet.
+#
+class CompiledSeq :
+
+    __slots__ = ("frameRanges", "nonSeqList")
+
+    def __init__(self, frameRanges, nonSeqList=()) :
+        self.frameRanges = frameRanges
+        self.nonSeqList = nonSeqList
+
+    def expand(self) :
+        return _expandRanges(self.frameRanges)
+
+    def iexpand(self) :
+        for frames in _iexpandChunks(self.frameRanges) :
+            yield from frames
+
+    def expandArray(self, asNumpy=False) :
+        return _expandRangesArray(self.frameRanges, asNumpy)
+
+    def frameSet(self) :
+        from .frameSet import FrameSet
+        return FrameSet._fromFrameRanges(self.frameRanges)
+
+    def __repr__(self) :
+        return "CompiledSeq(" + repr(self.frameRanges) + ")"
+
+def _ignore(item) :
+    pass
+
+# _rejecter() - Returns the callable that the expand and condense
+# functions hand the items they reject to, given their optional
+# 'nonSeqList' argument. The list is emptied first.
+#
+def _rejecter(nonSeqList) :
+    if nonSeqList is None :
+        return _ignore
+    nonSeqList.clear()
+    return nonSeqList.append
+
+# _lazyRejects - Stands in for the 'nonSeqList' of the functions that
+# return the rejected items as a tuple, such as condenseSeqResult(). Its
+# 'items' are the empty tuple (so tuple(items) is the shared empty
+# tuple) until the first item is appended, so that nothing more is
+# allocated when nothing is rejected, which is the usual case.
+#
+class _lazyRejects :
+
+    __slots__ = ("items",)
+
+    def __init__(self) :
+        self.items = ()
+
+    def clear(self) :
+        self.items = ()
+
+    def append(self, item) :
+        if self.items :
+            self.items.append(item)
+        else :
+            self.items = [item]
+
 class _gapRun :
-    def __init__(self, seqLen, startInd, gapSize, isCorrected=False) :
+    def __init__(self, seqLen, startFrame, gapSize, isCorrected=False) :
         self.seqLen = seqLen
-        self.startInd = startInd
+        self.startFrame = startFrame
         self.gapSize = gapSize
         self.isCorrected = isCorrected
 
     def __str__(self) :
         return "[seqLen = " + str(self.seqLen) + \
-            " startInd = " + str(self.startInd) + \
+            " startFrame = " + str(self.startFrame) + \
             " gapSize = " + str(self.gapSize) + \
             " isCorrected = " + str(self.isCorrected) + "]"
 
@@ -262,6 +799,45 @@ def __debugPrintList(li) :
     print()
 
 
+# _intFrames() - Turns the list of frames passed to condenseSeq() and
+# condenseSeqOnes(), a mix of ints and strings containing only
+# integers, into a list of ints. Anything else is handed to 'reject()'.
+#
+def _intFrames(seqList, reject) :
+    frames = []
+    for n in seqList :
+        if isinstance(n, int) :
+            frames.append(int(n))
+        elif isinstance(n, str) :
+            n = n.replace(",", " ")
+            nSplit = n.split()
+            for n in nSplit :
+                if n.isdigit() :
+                    frames.append(int(n))
+                elif n[0] == "-" and n[1:].isdigit() :
+                    frames.append(-1 * int(n[1:]))
+                else :
+                    reject(n)
+        else :
+            reject(n)
+    return frames
+
+# _isIntArray() - True if 'seqList' is a one dimensional array of
+# ints supporting the buffer protocol, for example a NumPy ndarray or
+# an array.array, which condenseSeq() and condenseSeqOnes() hand off
+# to the vectorized code in _numpyBackend.
+#
+def _isIntArray(seqList) :
+    if isinstance(seqList, (list, tuple, str)) :
+        return False
+    try :
+        view = memoryview(seqList)
+    except TypeError :
+        return False
+    return view.ndim == 1 and view.format.lstrip("@=<>!") in _intFormats
+
+_intFormats = ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "n", "N")
+
 # condenseSeq() - Takes a list of frames which can be a mix of ints
 # and strings. The strings must contain ONLY integers (that is,
 # NO Frame-Ranges). The list of frames is then condensed into the most
@@ -308,52 +884,65 @@ def __debugPrintList(li) :
 #
 # Any strings passed in that do not contain only frames
 # are ignored and that string is appended to the optional
-# argument "nonSeqList".
+# list "nonSeqList".
 #
 # New as of v1.2.0: Strings containing whitespace (and/or commas)
 # will be split into multiple list entries, and processed as
 # described above.
 #
-def condenseSeq(seqList, pad=1, nonSeqList=[]) :
+# 'seqList' may also be a one dimensional array of ints, such as a
+# NumPy ndarray or an array.array. If NumPy is installed, such arrays
+# are condensed with vectorized NumPy code instead of python loops.
+#
+def condenseSeq(seqList, pad=1, nonSeqList=None) :
 
-    condensedList = []
+    reject = _rejecter(nonSeqList)
 
-    nonSeqList.clear()
+    scoped = _scopedStats.get()
+    stats = _activeStats if scoped is None else scoped[0]
+    startTime = None
+    if stats is not None :
+        stats.condenseCalls += 1
+        startTime = time.perf_counter()
+
+    if _isIntArray(seqList) :
+        from . import _numpyBackend
+        return _numpyBackend.condenseIntArray(seqList, pad, stats=stats, startTime=startTime)
+
+    if _condenseCache is not None :
+        return _condenseCache.condense(seqList, reject, pad, False, _condenseInts, stats, startTime)
 
     # Turn seqList into all integers and stash invalid entries
     #
-    tmpSeqList = seqList
-    seqList = []
-    for n in tmpSeqList :
-        if isinstance(n, int) :
-            seqList.append(int(n))
-        elif isinstance(n, str) :
-            ## print("DEBUG: ", n)
-            n = n.replace(",", " ")
-            nSplit = n.split()
-            for n in nSplit :
-                if n.isdigit() :
-                    seqList.append(int(n))
-                elif n[0] == "-" and n[1:].isdigit() :
-                    seqList.append(-1 * int(n[1:]))
-                else :
-                    nonSeqList.append(n)
-        else :
-            nonSeqList.append(n)
+    seqList = _intFrames(seqList, reject)
+
+    return _condenseInts(seqList, pad, stats, startTime)
+
+# _condenseInts() - The rest of condenseSeq() once 'seqList' is a list
+# of ints. 'stats' is the active SeqStats, if any, and 'startTime'
+# when the call started.
+#
+def _condenseInts(seqList, pad, stats, startTime) :
+
+    condensedList = []
+
+    if _speedups is not None and stats is None :
+        fastList = _speedups.condenseFrames(seqList, pad, False)
+        if fastList is not None :
+            return fastList
 
     if len(seqList) == 0 : # Take care of 1st trivial case
         return condensedList
 
     # Remove duplicates
     #
-    seqList.sort()
-    tmpSeqList = seqList
-    seqList = []
-    seqList.append(tmpSeqList[0])
-    tmpSeqList.pop(0)
-    for n in tmpSeqList :
-        if n != seqList[-1] :
-            seqList.append(n)
+    frameCount = len(seqList)
+    seqList = _sortedUnique(seqList)
+
+    if stats is not None :
+        stats.dedupSeconds += time.perf_counter() - startTime
+        stats.framesCondensed += len(seqList)
+        stats.duplicatesDropped += frameCount - len(seqList)
 
     formatStr = "%0" + str(pad) + "d"
 
@@ -376,52 +965,111 @@ def condenseSeq(seqList, pad=1, nonSeqList=[]) :
     while i < len(gapList) :
         if gapList[i] != currentGap :
             currentGap = gapList[i]
-            gapRunList.append(_gapRun(2, i, currentGap))
+            gapRunList.append(_gapRun(2, seqList[i], currentGap))
         else :
             gapRunList[-1].seqLen += 1
         i += 1
-    gapRunList.append(_gapRun(0, i, 0)) # Add entry for last number in seqList (note zero gapSize)
+    gapRunList.append(_gapRun(0, seqList[i], 0)) # Add entry for last number in seqList (note zero gapSize)
 
-    # The largest runs steals from the prior and next runs last and first frame (respectively)
-    # if possible, working our way to smaller and smaller runs.
-    #
-    while True :
+    if stats is not None :
+        return _condenseGapRunsStats(gapRunList, formatStr, stats)
 
-        # Find largest run with smallest gapSize.
-        #
-        runInd = len(gapRunList) - 1 # This will contain index to desired run
-        maxSeqLen = 0
-        maxSeqLenGapSize = 0
-        i = 0
-        for run in gapRunList :
-            if not run.isCorrected :
-                if run.seqLen > maxSeqLen :
-                    runInd = i
-                    maxSeqLen = run.seqLen
-                    maxSeqLenGapSize = run.gapSize
-                elif run.seqLen == maxSeqLen and run.gapSize < maxSeqLenGapSize :
-                    runInd = i
-                    maxSeqLenGapSize = run.gapSize
-            i += 1
-
-        if runInd == len(gapRunList) - 1 :
-            break
-
-        gapRunList[runInd].isCorrected = True
-
-        if gapRunList[runInd].seqLen == 0 :
-            continue
+    return _condenseGapRuns(gapRunList, formatStr)
+
+# _sortedUnique() - Returns the (non-empty) list of ints 'frames'
+# sorted with duplicates removed. Lists which are already in strictly
+# increasing order, such as those from expandSeq(order="sorted"), are
+# returned as they are after one pass to check them.
+#
+def _sortedUnique(frames) :
+    if all(map(operator.lt, frames, itertools.islice(frames, 1, None))) :
+        return frames
+    frames.sort()
+    tmpSeqList = frames
+    frames = []
+    frames.append(tmpSeqList[0])
+    tmpSeqList.pop(0)
+    for n in tmpSeqList :
+        if n != frames[-1] :
+            frames.append(n)
+    return frames
+
+# _condenseGapRuns() - The heart of condenseSeq(). Takes the list of
+# _gapRuns describing a sorted list of (more than one) unique frames,
+# where each _gapRun is a maximal stretch of frames with the same gap
+# between them, followed by a zero length _gapRun for the last frame.
+# Returns the list of condensed Frame-Ranges formatted with 'formatStr'.
+#
+# Note that each _gapRun records the frame it starts at rather than
+# an index into the list of frames, so that the list of frames never
+# has to exist, see FrameSet.condense().
+#
+def _condenseGapRuns(gapRunList, formatStr) :
+    _selectGapRuns(gapRunList)
+    return _formatGapRuns(gapRunList, formatStr)
+
+# _condenseGapRunsStats() - _condenseGapRuns() while collecting SeqStats.
+#
+def _condenseGapRunsStats(gapRunList, formatStr, stats) :
+    startTime = time.perf_counter()
+    stats.selectionIterations += _selectGapRuns(gapRunList)
+    stats.selectSeconds += time.perf_counter() - startTime
+    stats.gapRuns += len(gapRunList)
+    return _formatGapRuns(gapRunList, formatStr)
+
+# _selectGapRuns() - The largest run steals from the prior and next
+# runs last and first frame (respectively) if possible, working our
+# way to smaller and smaller runs. When two runs are the same length
+# the one with the smaller gapSize goes first, and when those are the
+# same too, the earlier one does. Returns the number of runs taken from
+# the heap (including stale ones).
+#
+# Runs are taken from a heap ordered that way, so this is O(R log R)
+# in the number of runs R. As a run only ever gets shorter when a
+# neighbour steals from it, it is simply pushed again with its new
+# length and the stale entry is skipped when it comes off the heap.
+#
+def _selectGapRuns(gapRunList) :
+
+    runHeap = [(-run.seqLen, run.gapSize, i)
+        for i, run in enumerate(gapRunList) if run.seqLen > 0]
+    heapq.heapify(runHeap)
+
+    lastInd = len(gapRunList) - 1
+    iterations = 0
+
+    while runHeap :
+        negSeqLen, gapSize, runInd = heapq.heappop(runHeap)
+        iterations += 1
+        run = gapRunList[runInd]
+        if run.isCorrected or run.seqLen != -negSeqLen :
+            continue # Stale entry.
+
+        run.isCorrected = True
 
         # Correct prior sequence if possible.
         if runInd > 0 :
-            if not gapRunList[runInd-1].isCorrected :
-                gapRunList[runInd-1].seqLen -= 1
+            priorRun = gapRunList[runInd-1]
+            if not priorRun.isCorrected :
+                priorRun.seqLen -= 1
+                if priorRun.seqLen > 0 :
+                    heapq.heappush(runHeap, (-priorRun.seqLen, priorRun.gapSize, runInd-1))
 
         # Also correct next sequence if possible.
-        if runInd < len(gapRunList) - 1 :
-            if not gapRunList[runInd+1].isCorrected : # Means it was bigger than this one and we can't steal from it.
-                gapRunList[runInd+1].seqLen -= 1
-                gapRunList[runInd+1].startInd += 1
+        if runInd < lastInd :
+            nextRun = gapRunList[runInd+1]
+            if not nextRun.isCorrected : # Means it was bigger than this one and we can't steal from it.
+                nextRun.seqLen -= 1
+                nextRun.startFrame += nextRun.gapSize
+                if nextRun.seqLen > 0 :
+                    heapq.heappush(runHeap, (-nextRun.seqLen, nextRun.gapSize, runInd+1))
+
+    return iterations
+
+# _formatGapRuns() - Turns the _gapRuns left by _selectGapRuns()
+# into the list of Frame-Range strings.
+#
+def _formatGapRuns(gapRunList, formatStr) :
 
     condensedList = []
 
@@ -430,19 +1078,19 @@ def condenseSeq(seqList, pad=1, nonSeqList=[]) :
             continue
 
         if run.seqLen == 1 :
-            condensedList.append(formatStr % seqList[run.startInd])
+            condensedList.append(formatStr % run.startFrame)
             continue
 
         # Don't print out this case as a range, but as two separate entries.
         #
         if run.seqLen == 2 and run.gapSize > 1:
-            condensedList.append(formatStr % seqList[run.startInd])
-            condensedList.append(formatStr % seqList[run.startInd+1])
+            condensedList.append(formatStr % run.startFrame)
+            condensedList.append(formatStr % (run.startFrame + run.gapSize))
             continue
 
-        firstFrame = seqList[run.startInd]
-        lastFrame = seqList[run.startInd + run.seqLen - 1]
+        firstFrame = run.startFrame
         gap = run.gapSize
+        lastFrame = firstFrame + (run.seqLen - 1) * gap
         condensedList.append(formatStr % firstFrame +"-"+ formatStr % lastFrame)
         if gap > 1 :
             condensedList[-1] = condensedList[-1] + "x" + str(gap)
@@ -463,45 +1111,56 @@ def condenseSeq(seqList, pad=1, nonSeqList=[]) :
 #     condenseSeqOnes([0, 8, 16, 2, 4, 6, 10, 12, 13, 14])
 #         returns -> ['0', '2', '4', '6', '8', '10', '12-14', '16']
 #
-def condenseSeqOnes(seqList, pad=1, nonSeqList=[]) :
+# As with condenseSeq(), 'seqList' may also be an array of ints.
+#
+def condenseSeqOnes(seqList, pad=1, nonSeqList=None) :
 
-    condensedList = []
+    reject = _rejecter(nonSeqList)
 
-    nonSeqList.clear()
+    scoped = _scopedStats.get()
+    stats = _activeStats if scoped is None else scoped[0]
+    startTime = None
+    if stats is not None :
+        stats.condenseCalls += 1
+        startTime = time.perf_counter()
+
+    if _isIntArray(seqList) :
+        from . import _numpyBackend
+        return _numpyBackend.condenseIntArray(seqList, pad, ones=True, stats=stats, startTime=startTime)
+
+    if _condenseCache is not None :
+        return _condenseCache.condense(seqList, reject, pad, True, _condenseIntsOnes, stats, startTime)
 
     # Turn seqList into all integers and stash invalid entries
     #
-    tmpSeqList = seqList
-    seqList = []
-    for n in tmpSeqList :
-        if isinstance(n, int) :
-            seqList.append(int(n))
-        elif isinstance(n, str) :
-            n = n.replace(",", " ")
-            nSplit = n.split()
-            for n in nSplit :
-                if n.isdigit() :
-                    seqList.append(int(n))
-                elif n[0] == "-" and n[1:].isdigit() :
-                    seqList.append(-1 * int(n[1:]))
-                else:
-                    nonSeqList.append(n)
-        else:
-            nonSeqList.append(n)
+    seqList = _intFrames(seqList, reject)
+
+    return _condenseIntsOnes(seqList, pad, stats, startTime)
+
+# _condenseIntsOnes() - The rest of condenseSeqOnes() once 'seqList'
+# is a list of ints, as _condenseInts() above.
+#
+def _condenseIntsOnes(seqList, pad, stats, startTime) :
+
+    condensedList = []
+
+    if _speedups is not None and stats is None :
+        fastList = _speedups.condenseFrames(seqList, pad, True)
+        if fastList is not None :
+            return fastList
 
     if len(seqList) == 0 : # Take care of 1st trivial case
         return condensedList
 
     # Remove duplicates
     #
-    seqList.sort()
-    tmpSeqList = seqList
-    seqList = []
-    seqList.append(tmpSeqList[0])
-    tmpSeqList.pop(0)
-    for n in tmpSeqList :
-        if n != seqList[-1] :
-            seqList.append(n)
+    frameCount = len(seqList)
+    seqList = _sortedUnique(seqList)
+
+    if stats is not None :
+        stats.dedupSeconds += time.perf_counter() - startTime
+        stats.framesCondensed += len(seqList)
+        stats.duplicatesDropped += frameCount - len(seqList)
 
     formatStr = "%0" + str(pad) + "d"
 
@@ -533,3 +1192,239 @@ def condenseSeqOnes(seqList, pad=1, nonSeqList=[]) :
         condensedList.append(formatStr % firstFrame +"-"+ formatStr % lastFrame)
 
     return condensedList
+
+# SeqResult - The result of one of expandSeqResult(),
+# condenseSeqResult() or condenseSeqOnesResult() below, which is the
+# 'result' of the function of the same name without "Result", together
+# with the tuple of items it rejected, 'nonSeqList'. As 'nonSeqList' is
+# the shared empty tuple when nothing was rejected, and neither the
+# result nor the rejects are ever shared between calls, these may be
+# called from any number of threads at once. A SeqResult unpacks like
+# a tuple, for example:
+#
+#     frames, rejects = expandSeqResult(["1-3", "a-b"])
+#         frames -> [1, 2, 3], rejects -> ('a-b',)
+#
+class SeqResult :
+
+    __slots__ = ("result", "nonSeqList")
+
+    def __init__(self, result, nonSeqList=()) :
+        self.result = result
+        self.nonSeqList = nonSeqList
+
+    def __iter__(self) :
+        return iter((self.result, self.nonSeqList))
+
+    def __eq__(self, other) :
+        if not isinstance(other, SeqResult) :
+            return NotImplemented
+        return self.result == other.result and self.nonSeqList == other.nonSeqList
+
+    __hash__ = None
+
+    def __repr__(self) :
+        return "SeqResult(" + repr(self.result) + ", " + repr(self.nonSeqList) + ")"
+
+# expandSeqResult() - Returns the SeqResult of expandSeq(seqList).
+#
+def expandSeqResult(seqList) :
+    rejects = _lazyRejects()
+    return SeqResult(_expandRanges(_iterFrameRanges(seqList, rejects.append)), tuple(rejects.items))
+
+# condenseSeqResult() - Returns the SeqResult of condenseSeq(seqList, pad).
+#
+def condenseSeqResult(seqList, pad=1) :
+    rejects = _lazyRejects()
+    return SeqResult(condenseSeq(seqList, pad, rejects), tuple(rejects.items))
+
+# condenseSeqOnesResult() - Returns the SeqResult of
+# condenseSeqOnes(seqList, pad).
+#
+def condenseSeqOnesResult(seqList, pad=1) :
+    rejects = _lazyRejects()
+    return SeqResult(condenseSeqOnes(seqList, pad, rejects), tuple(rejects.items))
+
+# Instrumentation. While a SeqStats is active (see collectStats() and
+# enableStats() below) expandSeq(), condenseSeq() and condenseSeqOnes()
+# add what they did, and how long it took, to its counters:
+#
+#     expandCalls, condenseCalls - the number of calls.
+#     tokensParsed        - Frame-Ranges parsed by expandSeq() (or found
+#                           in the parse cache).
+#     framesGenerated     - frames returned by expandSeq().
+#     framesCondensed     - unique frames condensed.
+#     duplicatesDropped   - frames listed more than once, which were
+#                           dropped by either.
+#     gapRuns             - _gapRuns built by condenseSeq().
+#     selectionIterations - runs taken from the heap of _gapRuns.
+#     parseSeconds, expandSeconds - the time expandSeq() spent parsing
+#                           and expanding Frame-Ranges.
+#     dedupSeconds        - the time condenseSeq() and condenseSeqOnes()
+#                           spent turning their arguments into a sorted
+#                           list of unique ints.
+#     selectSeconds       - the time spent choosing the Frame-Ranges
+#                           from the _gapRuns.
+#
+# A SeqStats used as a context manager is active only in the thread
+# (or asyncio task) which entered it, through _scopedStats, and takes
+# precedence over the process wide one set by enableStats() in
+# _activeStats. When no SeqStats is active the only cost is a lookup
+# of _scopedStats and a test of _activeStats per call. The counters
+# aren't locked, so the process wide SeqStats may miss a few counts
+# when several threads update it at once. For example:
+#
+#     with collectStats() as stats :
+#         condenseSeq(frames)
+#     sendToMetrics(stats.asDict())
+#
+_activeStats = None
+
+# _scopedStats - The SeqStats entered in this context, as a
+# (SeqStats, enclosing scope) pair so that __exit__ can restore the
+# enclosing one, or None.
+#
+_scopedStats = contextvars.ContextVar("seqLister._scopedStats", default=None)
+
+class SeqStats :
+
+    _counters = ("expandCalls", "condenseCalls", "tokensParsed", "framesGenerated",
+        "framesCondensed", "duplicatesDropped", "gapRuns", "selectionIterations",
+        "parseSeconds", "expandSeconds", "dedupSeconds", "selectSeconds")
+
+    __slots__ = _counters
+
+    def __init__(self) :
+        self.reset()
+
+    # reset() - Sets all the counters back to zero.
+    #
+    def reset(self) :
+        for name in SeqStats._counters :
+            setattr(self, name, 0.0 if name.endswith("Seconds") else 0)
+
+    # asDict() - Returns the counters as a dict, for exporting.
+    #
+    def asDict(self) :
+        return {name : getattr(self, name) for name in SeqStats._counters}
+
+    # Using a SeqStats as a context manager makes it the active one in
+    # the current thread or task for the duration, and then restores
+    # whichever was active there before.
+    #
+    def __enter__(self) :
+        _scopedStats.set((self, _scopedStats.get()))
+        return self
+
+    def __exit__(self, excType, excValue, traceback) :
+        _scopedStats.set(_scopedStats.get()[1])
+        return False
+
+    def __repr__(self) :
+        return "SeqStats(" + ", ".join([name + "=" + repr(value)
+            for name, value in self.asDict().items()]) + ")"
+
+# collectStats() - Returns a new SeqStats (or 'stats' if given) to be
+# used as a context manager, within which expandSeq(), condenseSeq()
+# and condenseSeqOnes() called by the same thread or task add to its
+# counters.
+#
+def collectStats(stats=None) :
+    if stats is None :
+        stats = SeqStats()
+    return stats
+
+# enableStats() - Makes a new SeqStats (or 'stats' if given) the active
+# one, for all later calls (in every thread, outside of collectStats()
+# blocks) until disableStats(), and returns it. This suits a long
+# running process which exports the counters now and then.
+#
+def enableStats(stats=None) :
+    global _activeStats
+    if stats is None :
+        stats = SeqStats()
+    _activeStats = stats
+    return stats
+
+# disableStats() - Stops collecting SeqStats.
+#
+def disableStats() :
+    global _activeStats
+    _activeStats = None
+
+# The condense cache, off by default, memoizes condenseSeq() and
+# condenseSeqOnes() by a fingerprint of the frames given to them (see
+# condenseCache.py). While it is on each call pays for fingerprinting
+# its frames, so it only pays off when the same frames come round again.
+#
+_condenseCache = None
+
+# enableCondenseCache() - Turns on the condense cache, or resizes it
+# (clearing it) if it is already on. At most 'maxEntries' results are
+# kept, taking roughly no more than 'maxBytes' of memory.
+#
+def enableCondenseCache(maxEntries=1024, maxBytes=32 * 1024 * 1024) :
+    global _condenseCache
+    from .condenseCache import _CondenseCache
+    _condenseCache = _CondenseCache(maxEntries, maxBytes)
+
+# disableCondenseCache() - Turns off the condense cache and frees it.
+#
+def disableCondenseCache() :
+    global _condenseCache
+    _condenseCache = None
+
+# clearCondenseCache() - Empties the condense cache and zeroes its hit
+# and miss counts, leaving it on.
+#
+def clearCondenseCache() :
+    if _condenseCache is not None :
+        _condenseCache.clear()
+
+# condenseCacheInfo() - Returns a CondenseCacheInfo named tuple of
+# (hits, misses, maxEntries, currEntries, maxBytes, currBytes) for the
+# condense cache, all zeros when it is off.
+#
+def condenseCacheInfo() :
+    from .condenseCache import CondenseCacheInfo
+    if _condenseCache is None :
+        return CondenseCacheInfo(0, 0, 0, 0, 0, 0)
+    return _condenseCache.info()
+
+# The rest of the public names live in submodules which are only
+# imported when one of their names is first used, e.g. seqLister.FrameSet,
+# so that "import seqLister" stays cheap for the many short-lived
+# processes that only want expandSeq() or condenseSeq(). Each maps to
+# the submodule it is defined in. (Needs python 3.7 or later.)
+#
+_lazyNames = {
+    "FrameSet" : "frameSet",
+    "normalizeSeq" : "frameSet",
+    "splitSeq" : "frameSet",
+    "SeqCondenser" : "seqCondenser",
+    "missingFrames" : "seqCondenser",
+    "expandMany" : "batch",
+    "condenseMany" : "batch",
+    "FileSeq" : "fileSeq",
+    "scanDir" : "fileSeq",
+    "CondenseCacheInfo" : "condenseCache",
+    "expandSeqAsync" : "asyncSeq",
+    "condenseSeqAsync" : "asyncSeq",
+    "condenseSeqOnesAsync" : "asyncSeq",
+    "iexpandSeqAsync" : "asyncSeq",
+    "dumps" : "binarySeq",
+    "loads" : "binarySeq",
+}
+
+def __getattr__(name) :
+    moduleName = _lazyNames.get(name)
+    if moduleName is None :
+        if name not in _lazyNames.values() :
+            raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+        return __import__(__name__ + "." + name, fromlist=["_"]) # The submodule itself.
+    value = getattr(__import__(__name__ + "." + moduleName, fromlist=["_"]), name)
+    globals()[name] = value
+    return value
+
+def __dir__() :
+    return sorted(set(globals()) | set(_lazyNames))
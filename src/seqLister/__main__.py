@@ -0,0 +1,7 @@
+# Lets "python3 -m seqLister" run the seqlister command, see cli.py.
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
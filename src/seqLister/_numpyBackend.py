@@ -0,0 +1,124 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# Vectorized versions of condenseSeq() and condenseSeqOnes() for
+# frames held in an array of ints (a NumPy ndarray, array.array, or
+# anything else supporting the buffer protocol) rather than a list.
+#
+# NumPy is optional. When it is installed the sort, dedup, gaps and
+# run boundaries are all computed with NumPy and only the runs (not the
+# frames) are looked at in python. Otherwise the array is turned into
+# a list and handed to the pure python code, as are arrays whose
+# frames, or the gaps between them, don't fit in an int64.
+#
+# This module is only imported the first time condenseSeq() or
+# condenseSeqOnes() is passed an array, and NumPy only then too.
+
+from . import _intFrames, _ignore, _condenseInts, _condenseIntsOnes, _gapRun, _condenseGapRuns
+
+_int64Min = -(1 << 63)
+_int64Max = (1 << 63) - 1
+
+_np = None
+_npChecked = False
+
+def _numpy() :
+    global _np, _npChecked
+    if not _npChecked :
+        try :
+            import numpy
+            _np = numpy
+        except ImportError :
+            _np = None
+        _npChecked = True
+    return _np
+
+# condenseIntArray() - Returns the same as condenseSeq(list(frames), pad)
+# or, if 'ones' is True, condenseSeqOnes(list(frames), pad) where
+# 'frames' is a one dimensional array of ints. 'stats' and 'startTime'
+# are passed on to the python code, as from condenseSeq().
+#
+def condenseIntArray(frames, pad=1, ones=False, stats=None, startTime=None) :
+
+    np = _numpy()
+    if np is None :
+        return _condenseList(frames, pad, ones, stats, startTime)
+
+    formatStr = "%0" + str(pad) + "d"
+
+    frameArray = np.unique(np.asarray(frames)) # Sorted with no duplicates.
+
+    if frameArray.size == 0 :
+        return []
+    if frameArray.size == 1 :
+        return [formatStr % int(frameArray[0])]
+
+    # Widen to int64 before taking the gaps, so that narrow and
+    # unsigned integer types don't wrap around, leaving anything whose
+    # gaps could overflow an int64 to the python code.
+    #
+    lo = int(frameArray[0])
+    hi = int(frameArray[-1])
+    if lo < _int64Min or hi > _int64Max or hi - lo > _int64Max :
+        return _condenseList(frames, pad, ones, stats, startTime)
+    frameArray = frameArray.astype(np.int64)
+    gaps = np.diff(frameArray)
+
+    if ones :
+        breaks = np.flatnonzero(gaps != 1)
+        firstFrames = frameArray[np.concatenate(([0], breaks + 1))].tolist()
+        lastFrames = frameArray[np.concatenate((breaks, [frameArray.size - 1]))].tolist()
+        return [formatStr % first if first == last else
+                formatStr % first +"-"+ formatStr % last
+            for first, last in zip(firstFrames, lastFrames)]
+
+    # Each _gapRun starts where the gap differs from the one before.
+    #
+    runStarts = np.concatenate(([0], np.flatnonzero(gaps[1:] != gaps[:-1]) + 1))
+    runGapCounts = np.diff(np.concatenate((runStarts, [gaps.size])))
+
+    gapRunList = [_gapRun(gapCount + 1, startFrame, gapSize)
+        for gapCount, startFrame, gapSize in zip(runGapCounts.tolist(),
+            frameArray[runStarts].tolist(), gaps[runStarts].tolist())]
+    gapRunList.append(_gapRun(0, int(frameArray[-1]), 0)) # Add entry for last frame (note zero gapSize)
+
+    return _condenseGapRuns(gapRunList, formatStr)
+
+def _condenseList(frames, pad, ones, stats, startTime) :
+    frameList = _intFrames(memoryview(frames).tolist(), _ignore)
+    if ones :
+        return _condenseIntsOnes(frameList, pad, stats, startTime)
+    return _condenseInts(frameList, pad, stats, startTime)
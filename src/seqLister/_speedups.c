@@ -0,0 +1,812 @@
+/*
+ * BSD 3-Clause License
+ *
+ * Copyright (c) 2008-2026, James Philip Rowell,
+ * Alpha Eleven Incorporated
+ * www.alpha-eleven.com
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met:
+ *
+ *   - Redistributions of source code must retain the above copyright
+ *     notice, this list of conditions and the following disclaimer.
+ *
+ *   - Redistributions in binary form must reproduce the above copyright
+ *     notice, this list of conditions and the following disclaimer in
+ *     the documentation and/or other materials provided with the
+ *     distribution.
+ *
+ *   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+ *     contributors may be used to endorse or promote products derived
+ *     from this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+ * HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+/*
+ * _speedups - optional C versions of the kernels of seqLister, used by
+ * __init__.py when this module has been built (see setup.py). The
+ * python code in __init__.py is the reference implementation, and
+ * these must return exactly what it does.
+ *
+ * Each function returns None for any input it doesn't handle (frames
+ * too large for 64 bits, non-ASCII strings and so on), in which case
+ * the caller falls back to the python code.
+ *
+ *     parseSeqString(seqItem)         - _parseSeqStringUncached()
+ *     expandRanges(frameRanges)       - _expandRanges()
+ *     condenseFrames(frames, pad, ones) - the sort, dedup, run
+ *         selection and formatting of condenseSeq() (or
+ *         condenseSeqOnes() when 'ones' is true) for a list of ints.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+/* Frames are limited to this magnitude so that the difference of any
+ * two of them, and a frame plus a step, fits in a long long. */
+#define FRAME_LIMIT (1LL << 62)
+
+/* Zero-padding wider than this is left to python. */
+#define PAD_LIMIT 64
+
+typedef long long frame_t;
+
+/* -------------------------------------------------------------------
+ * parseSeqString()
+ */
+
+static int
+isSeparator(unsigned char c)
+{
+    /* The ASCII characters matching the [\s,] of _frameRangeRE. */
+    return c == ',' || c == ' ' || (c >= '\t' && c <= '\r') || (c >= 0x1c && c <= 0x1f);
+}
+
+static int
+isDigit(unsigned char c)
+{
+    return c >= '0' && c <= '9';
+}
+
+/* Reads an optionally negative ('allowSign') integer at *pos, leaving
+ * *pos after it. Returns 1 on success, 0 when there's no integer
+ * there, and -1 when it is too large. */
+static int
+readInt(const char *s, Py_ssize_t end, Py_ssize_t *pos, int allowSign, frame_t *value)
+{
+    Py_ssize_t i = *pos;
+    int negative = 0;
+    frame_t n = 0;
+
+    if (allowSign && i < end && s[i] == '-') {
+        negative = 1;
+        i++;
+    }
+    if (i >= end || !isDigit(s[i]))
+        return 0;
+    while (i < end && isDigit(s[i])) {
+        if (n >= FRAME_LIMIT / 10)
+            return -1;
+        n = n * 10 + (s[i] - '0');
+        i++;
+    }
+    *pos = i;
+    *value = negative ? -n : n;
+    return 1;
+}
+
+/* Parses the token s[start:end]. Returns 1 with the Frame-Range in
+ * frameRange[], 0 when it isn't a Frame-Range and -1 when the numbers
+ * are too large. */
+static int
+parseToken(const char *s, Py_ssize_t start, Py_ssize_t end, frame_t frameRange[3])
+{
+    Py_ssize_t pos = start;
+    frame_t a, b = 0, n = 0;
+    int hasEnd = 0, hasStep = 0, found;
+
+    found = readInt(s, end, &pos, 1, &a);
+    if (found <= 0)
+        return found;
+
+    if (pos < end && s[pos] == '-') {
+        Py_ssize_t save = pos++;
+        found = readInt(s, end, &pos, 1, &b);
+        if (found < 0)
+            return found;
+        if (found)
+            hasEnd = 1;
+        else
+            pos = save;
+    }
+    if (pos < end && s[pos] == 'x') {
+        Py_ssize_t save = pos++;
+        if (pos < end && s[pos] == '-')
+            pos++;
+        found = readInt(s, end, &pos, 0, &n);
+        if (found < 0)
+            return found;
+        if (found)
+            hasStep = 1;
+        else
+            pos = save;
+    }
+    if (pos != end)
+        return 0;
+
+    /* As _frameRangeFromGroups(). */
+    frameRange[0] = a;
+    if (!hasEnd || a == b) {
+        frameRange[1] = a;
+        frameRange[2] = 1;
+        return 1;
+    }
+    frameRange[1] = b;
+    if (!hasStep) {
+        frameRange[2] = 1;
+        return 1;
+    }
+    if (n == 0)
+        return 0;
+    frameRange[2] = n;
+    return 1;
+}
+
+static PyObject *
+frameRangeTuple(frame_t frameRange[3])
+{
+    return Py_BuildValue("(LLL)", frameRange[0], frameRange[1], frameRange[2]);
+}
+
+static PyObject *
+parseSeqString(PyObject *module, PyObject *seqItem)
+{
+    const char *s;
+    Py_ssize_t len, pos = 0;
+    PyObject *items;
+
+    if (!PyUnicode_Check(seqItem)) {
+        PyErr_SetString(PyExc_TypeError, "parseSeqString() expects a str");
+        return NULL;
+    }
+    if (PyUnicode_READY(seqItem) < 0)
+        return NULL;
+    if (!PyUnicode_IS_ASCII(seqItem))
+        Py_RETURN_NONE;
+
+    s = (const char *)PyUnicode_DATA(seqItem);
+    len = PyUnicode_GET_LENGTH(seqItem);
+
+    items = PyList_New(0);
+    if (items == NULL)
+        return NULL;
+
+    while (pos < len) {
+        Py_ssize_t start;
+        frame_t frameRange[3];
+        PyObject *item;
+        int parsed;
+
+        if (isSeparator(s[pos])) {
+            pos++;
+            continue;
+        }
+        start = pos;
+        while (pos < len && !isSeparator(s[pos]))
+            pos++;
+
+        parsed = parseToken(s, start, pos, frameRange);
+        if (parsed < 0) {
+            Py_DECREF(items);
+            Py_RETURN_NONE;
+        }
+        if (parsed) {
+            item = frameRangeTuple(frameRange);
+            if (item == NULL) {
+                Py_DECREF(items);
+                return NULL;
+            }
+        }
+        else {
+            item = Py_None;
+            Py_INCREF(item);
+        }
+        if (PyList_Append(items, item) < 0) {
+            Py_DECREF(item);
+            Py_DECREF(items);
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+
+    {
+        PyObject *result = PyList_AsTuple(items);
+        Py_DECREF(items);
+        return result;
+    }
+}
+
+/* -------------------------------------------------------------------
+ * Converting python ints.
+ */
+
+/* Sets *value to the python int 'obj'. Returns 1 on success, 0 when
+ * 'obj' isn't an int or is out of range, and -1 on error. */
+static int
+asFrame(PyObject *obj, frame_t *value)
+{
+    int overflow;
+    frame_t n;
+
+    if (!PyLong_Check(obj))
+        return 0;
+    n = PyLong_AsLongLongAndOverflow(obj, &overflow);
+    if (n == -1 && PyErr_Occurred())
+        return -1;
+    if (overflow || n >= FRAME_LIMIT || n <= -FRAME_LIMIT)
+        return 0;
+    *value = n;
+    return 1;
+}
+
+static PyObject *
+framesToList(const frame_t *frames, Py_ssize_t count)
+{
+    PyObject *list = PyList_New(count);
+    Py_ssize_t i;
+
+    if (list == NULL)
+        return NULL;
+    for (i = 0; i < count; i++) {
+        PyObject *n = PyLong_FromLongLong(frames[i]);
+        if (n == NULL) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyList_SET_ITEM(list, i, n);
+    }
+    return list;
+}
+
+/* -------------------------------------------------------------------
+ * expandRanges()
+ */
+
+typedef struct {
+    frame_t start, end, step; /* As parsed: end < start counts down. */
+    frame_t lo, hi;           /* The lowest and highest frames. */
+    Py_ssize_t count;         /* The number of frames. */
+} frameRange_t;
+
+static int
+compareLo(const void *a, const void *b)
+{
+    const frameRange_t *ra = *(const frameRange_t * const *)a;
+    const frameRange_t *rb = *(const frameRange_t * const *)b;
+    return (ra->lo > rb->lo) - (ra->lo < rb->lo);
+}
+
+/* The frames are expanded straight into the list when no two ranges
+ * have overlapping spans, else into a buffer, dropping the frames
+ * already marked in a bitmap spanning all the frames. When that
+ * bitmap would be much larger than the frames (a few sparse but
+ * overlapping ranges far apart) python does it instead. */
+static PyObject *
+expandRanges(PyObject *module, PyObject *arg)
+{
+    PyObject *seq, *result = NULL;
+    Py_ssize_t nRanges, i, total = 0;
+    frameRange_t *ranges = NULL;
+    frameRange_t **byLo = NULL;
+    frame_t *frames = NULL;
+    unsigned char *bitmap = NULL;
+    int overlap = 0;
+
+    seq = PySequence_Fast(arg, "expandRanges() expects a sequence");
+    if (seq == NULL)
+        return NULL;
+    nRanges = PySequence_Fast_GET_SIZE(seq);
+    if (nRanges == 0) {
+        Py_DECREF(seq);
+        return PyList_New(0);
+    }
+
+    ranges = PyMem_Malloc(nRanges * sizeof(frameRange_t));
+    byLo = PyMem_Malloc(nRanges * sizeof(frameRange_t *));
+    if (ranges == NULL || byLo == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    for (i = 0; i < nRanges; i++) {
+        PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+        frameRange_t *r = &ranges[i];
+        frame_t values[3], span;
+        int j;
+
+        if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 3)
+            goto fallBack;
+        for (j = 0; j < 3; j++) {
+            int ok = asFrame(PyTuple_GET_ITEM(item, j), &values[j]);
+            if (ok < 0)
+                goto done;
+            if (!ok)
+                goto fallBack;
+        }
+        r->start = values[0];
+        r->end = values[1];
+        r->step = values[2];
+        if (r->step <= 0)
+            goto fallBack;
+
+        if (r->start <= r->end) {
+            span = (r->end - r->start) / r->step * r->step;
+            r->lo = r->start;
+            r->hi = r->start + span;
+        }
+        else {
+            span = (r->start - r->end) / r->step * r->step;
+            r->lo = r->start - span;
+            r->hi = r->start;
+        }
+        r->count = (Py_ssize_t)(span / r->step + 1);
+        if (span / r->step + 1 > PY_SSIZE_T_MAX / 16 - total)
+            goto fallBack; /* Let python run out of memory. */
+        total += r->count;
+        byLo[i] = r;
+    }
+
+    qsort(byLo, nRanges, sizeof(frameRange_t *), compareLo);
+    for (i = 1; i < nRanges; i++) {
+        if (byLo[i]->lo <= byLo[i-1]->hi) {
+            overlap = 1;
+            break;
+        }
+    }
+
+    if (!overlap) {
+        Py_ssize_t k = 0;
+        result = PyList_New(total);
+        if (result == NULL)
+            goto done;
+        for (i = 0; i < nRanges; i++) {
+            frameRange_t *r = &ranges[i];
+            frame_t f = r->start, delta = r->start <= r->end ? r->step : -r->step;
+            Py_ssize_t c;
+            for (c = 0; c < r->count; c++, f += delta) {
+                PyObject *n = PyLong_FromLongLong(f);
+                if (n == NULL) {
+                    Py_CLEAR(result);
+                    goto done;
+                }
+                PyList_SET_ITEM(result, k++, n);
+            }
+        }
+    }
+    else {
+        frame_t lo = byLo[0]->lo, hi = byLo[0]->hi;
+        unsigned long long bits;
+        Py_ssize_t k = 0;
+
+        for (i = 1; i < nRanges; i++)
+            if (byLo[i]->hi > hi)
+                hi = byLo[i]->hi;
+        bits = (unsigned long long)(hi - lo) + 1;
+        if (bits / 8 > (unsigned long long)total * 4 + 4096)
+            goto fallBack;
+
+        bitmap = PyMem_Calloc((size_t)(bits / 8 + 1), 1);
+        frames = PyMem_Malloc(total * sizeof(frame_t));
+        if (bitmap == NULL || frames == NULL) {
+            PyErr_NoMemory();
+            goto done;
+        }
+        for (i = 0; i < nRanges; i++) {
+            frameRange_t *r = &ranges[i];
+            frame_t f = r->start, delta = r->start <= r->end ? r->step : -r->step;
+            Py_ssize_t c;
+            for (c = 0; c < r->count; c++, f += delta) {
+                unsigned long long bit = (unsigned long long)(f - lo);
+                unsigned char mask = (unsigned char)(1 << (bit & 7));
+                if (!(bitmap[bit >> 3] & mask)) {
+                    bitmap[bit >> 3] |= mask;
+                    frames[k++] = f;
+                }
+            }
+        }
+        result = framesToList(frames, k);
+    }
+    goto done;
+
+fallBack:
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+done:
+    PyMem_Free(ranges);
+    PyMem_Free(byLo);
+    PyMem_Free(frames);
+    PyMem_Free(bitmap);
+    Py_DECREF(seq);
+    return result;
+}
+
+/* -------------------------------------------------------------------
+ * condenseFrames()
+ */
+
+static int
+compareFrames(const void *a, const void *b)
+{
+    frame_t fa = *(const frame_t *)a, fb = *(const frame_t *)b;
+    return (fa > fb) - (fa < fb);
+}
+
+/* The _gapRuns of condenseSeq(). */
+typedef struct {
+    frame_t seqLen, startFrame, gapSize;
+    int isCorrected;
+} gapRun_t;
+
+/* An entry of the heap of _selectGapRuns(), ordered by
+ * (-seqLen, gapSize, index). */
+typedef struct {
+    frame_t seqLen, gapSize;
+    Py_ssize_t index;
+} heapEntry_t;
+
+static int
+heapLess(const heapEntry_t *a, const heapEntry_t *b)
+{
+    if (a->seqLen != b->seqLen)
+        return a->seqLen > b->seqLen;
+    if (a->gapSize != b->gapSize)
+        return a->gapSize < b->gapSize;
+    return a->index < b->index;
+}
+
+static void
+heapPush(heapEntry_t *heap, Py_ssize_t *size, heapEntry_t entry)
+{
+    Py_ssize_t i = (*size)++;
+    while (i > 0) {
+        Py_ssize_t parent = (i - 1) / 2;
+        if (!heapLess(&entry, &heap[parent]))
+            break;
+        heap[i] = heap[parent];
+        i = parent;
+    }
+    heap[i] = entry;
+}
+
+static heapEntry_t
+heapPop(heapEntry_t *heap, Py_ssize_t *size)
+{
+    heapEntry_t top = heap[0], last = heap[--(*size)];
+    Py_ssize_t i = 0, n = *size;
+
+    for (;;) {
+        Py_ssize_t child = 2 * i + 1;
+        if (child >= n)
+            break;
+        if (child + 1 < n && heapLess(&heap[child + 1], &heap[child]))
+            child++;
+        if (!heapLess(&heap[child], &last))
+            break;
+        heap[i] = heap[child];
+        i = child;
+    }
+    if (n > 0)
+        heap[i] = last;
+    return top;
+}
+
+/* _selectGapRuns(). */
+static void
+selectGapRuns(gapRun_t *runs, Py_ssize_t nRuns, heapEntry_t *heap)
+{
+    Py_ssize_t size = 0, i, lastInd = nRuns - 1;
+
+    for (i = 0; i < nRuns; i++) {
+        if (runs[i].seqLen > 0) {
+            heapEntry_t entry = {runs[i].seqLen, runs[i].gapSize, i};
+            heapPush(heap, &size, entry);
+        }
+    }
+
+    while (size > 0) {
+        heapEntry_t entry = heapPop(heap, &size);
+        gapRun_t *run = &runs[entry.index];
+        Py_ssize_t runInd = entry.index;
+
+        if (run->isCorrected || run->seqLen != entry.seqLen)
+            continue; /* Stale entry. */
+
+        run->isCorrected = 1;
+
+        if (runInd > 0) {
+            gapRun_t *priorRun = &runs[runInd - 1];
+            if (!priorRun->isCorrected) {
+                priorRun->seqLen -= 1;
+                if (priorRun->seqLen > 0) {
+                    heapEntry_t prior = {priorRun->seqLen, priorRun->gapSize, runInd - 1};
+                    heapPush(heap, &size, prior);
+                }
+            }
+        }
+        if (runInd < lastInd) {
+            gapRun_t *nextRun = &runs[runInd + 1];
+            if (!nextRun->isCorrected) {
+                nextRun->seqLen -= 1;
+                nextRun->startFrame += nextRun->gapSize;
+                if (nextRun->seqLen > 0) {
+                    heapEntry_t next = {nextRun->seqLen, nextRun->gapSize, runInd + 1};
+                    heapPush(heap, &size, next);
+                }
+            }
+        }
+    }
+}
+
+/* Appends the zero-padded frame, or range of frames, to 'list'. */
+static int
+appendFrameRange(PyObject *list, int pad, frame_t first, frame_t last, frame_t gap)
+{
+    char buf[3 * (PAD_LIMIT + 24)];
+    int len;
+    PyObject *str;
+
+    if (first == last)
+        len = snprintf(buf, sizeof(buf), "%0*lld", pad, first);
+    else if (gap > 1)
+        len = snprintf(buf, sizeof(buf), "%0*lld-%0*lldx%lld", pad, first, pad, last, gap);
+    else
+        len = snprintf(buf, sizeof(buf), "%0*lld-%0*lld", pad, first, pad, last);
+
+    str = PyUnicode_FromStringAndSize(buf, len);
+    if (str == NULL)
+        return -1;
+    if (PyList_Append(list, str) < 0) {
+        Py_DECREF(str);
+        return -1;
+    }
+    Py_DECREF(str);
+    return 0;
+}
+
+static PyObject *
+condenseFrames(PyObject *module, PyObject *args)
+{
+    PyObject *seq, *padObj, *result = NULL;
+    int ones, overflow;
+    long pad;
+    Py_ssize_t n, i, unique;
+    frame_t *frames = NULL;
+    gapRun_t *runs = NULL;
+    heapEntry_t *heap = NULL;
+
+    if (!PyArg_ParseTuple(args, "O!Op:condenseFrames", &PyList_Type, &seq, &padObj, &ones))
+        return NULL;
+
+    /* Only plain ints in [0, PAD_LIMIT] give the same padding as
+     * python's "%0" + str(pad) + "d". */
+    if (!PyLong_CheckExact(padObj))
+        Py_RETURN_NONE;
+    pad = PyLong_AsLongAndOverflow(padObj, &overflow);
+    if (overflow || pad < 0 || pad > PAD_LIMIT)
+        Py_RETURN_NONE;
+
+    n = PyList_GET_SIZE(seq);
+    if (n == 0)
+        return PyList_New(0);
+
+    frames = PyMem_Malloc(n * sizeof(frame_t));
+    if (frames == NULL)
+        return PyErr_NoMemory();
+    for (i = 0; i < n; i++) {
+        int ok = asFrame(PyList_GET_ITEM(seq, i), &frames[i]);
+        if (ok < 0)
+            goto done;
+        if (!ok) {
+            Py_INCREF(Py_None);
+            result = Py_None;
+            goto done;
+        }
+    }
+
+    /* Sort and remove duplicates, letting other threads run meanwhile. */
+    Py_BEGIN_ALLOW_THREADS
+    qsort(frames, n, sizeof(frame_t), compareFrames);
+    unique = 1;
+    for (i = 1; i < n; i++)
+        if (frames[i] != frames[unique - 1])
+            frames[unique++] = frames[i];
+    Py_END_ALLOW_THREADS
+
+    result = PyList_New(0);
+    if (result == NULL)
+        goto done;
+
+    if (unique == 1) {
+        if (appendFrameRange(result, (int)pad, frames[0], frames[0], 1) < 0)
+            Py_CLEAR(result);
+        goto done;
+    }
+
+    if (ones) {
+        frame_t first = frames[0], last = frames[0];
+        for (i = 1; i <= unique; i++) {
+            if (i < unique && frames[i] == last + 1) {
+                last = frames[i];
+                continue;
+            }
+            if (appendFrameRange(result, (int)pad, first, last, 1) < 0) {
+                Py_CLEAR(result);
+                goto done;
+            }
+            if (i < unique)
+                first = last = frames[i];
+        }
+        goto done;
+    }
+
+    /* Count lengths of similar "gaps", as condenseSeq(). */
+    {
+        Py_ssize_t nRuns = 0;
+        frame_t currentGap = 0;
+
+        runs = PyMem_Malloc(unique * sizeof(gapRun_t));
+        heap = PyMem_Malloc(2 * unique * sizeof(heapEntry_t));
+        if (runs == NULL || heap == NULL) {
+            PyErr_NoMemory();
+            Py_CLEAR(result);
+            goto done;
+        }
+        Py_BEGIN_ALLOW_THREADS
+        for (i = 0; i < unique - 1; i++) {
+            frame_t gap = frames[i + 1] - frames[i];
+            if (gap != currentGap) {
+                currentGap = gap;
+                runs[nRuns].seqLen = 2;
+                runs[nRuns].startFrame = frames[i];
+                runs[nRuns].gapSize = gap;
+                runs[nRuns].isCorrected = 0;
+                nRuns++;
+            }
+            else
+                runs[nRuns - 1].seqLen += 1;
+        }
+        runs[nRuns].seqLen = 0; /* Entry for the last frame. */
+        runs[nRuns].startFrame = frames[unique - 1];
+        runs[nRuns].gapSize = 0;
+        runs[nRuns].isCorrected = 0;
+        nRuns++;
+
+        selectGapRuns(runs, nRuns, heap);
+        Py_END_ALLOW_THREADS
+
+        /* _formatGapRuns(). */
+        for (i = 0; i < nRuns; i++) {
+            gapRun_t *run = &runs[i];
+            int failed;
+            if (run->seqLen <= 0)
+                continue;
+            if (run->seqLen == 1)
+                failed = appendFrameRange(result, (int)pad, run->startFrame, run->startFrame, 1);
+            else if (run->seqLen == 2 && run->gapSize > 1)
+                failed = appendFrameRange(result, (int)pad, run->startFrame, run->startFrame, 1) < 0 ||
+                    appendFrameRange(result, (int)pad, run->startFrame + run->gapSize,
+                        run->startFrame + run->gapSize, 1) < 0;
+            else
+                failed = appendFrameRange(result, (int)pad, run->startFrame,
+                    run->startFrame + (run->seqLen - 1) * run->gapSize, run->gapSize);
+            if (failed) {
+                Py_CLEAR(result);
+                goto done;
+            }
+        }
+    }
+
+done:
+    PyMem_Free(frames);
+    PyMem_Free(runs);
+    PyMem_Free(heap);
+    return result;
+}
+
+/* -------------------------------------------------------------------
+ * frameFingerprint()
+ */
+
+/* The finalizer of splitmix64, so that the sum in frameFingerprint()
+ * depends on every bit of every frame. */
+static unsigned long long
+mixFrame(unsigned long long x)
+{
+    x ^= x >> 30;
+    x *= 0xbf58476d1ce4e5b9ULL;
+    x ^= x >> 27;
+    x *= 0x94d049bb133111ebULL;
+    x ^= x >> 31;
+    return x;
+}
+
+/* The condense cache's key for a list of frames, made in one pass
+ * without a copy: (count, lowest, highest, sum of the mixed frames
+ * modulo 2**64), which doesn't depend on their order. None unless
+ * the list is of plain ints which fit in 64 bits. */
+static PyObject *
+frameFingerprint(PyObject *module, PyObject *seq)
+{
+    Py_ssize_t n, i;
+    frame_t lo = 0, hi = 0;
+    unsigned long long sum = 0;
+
+    if (!PyList_Check(seq))
+        Py_RETURN_NONE;
+    n = PyList_GET_SIZE(seq);
+    for (i = 0; i < n; i++) {
+        PyObject *item = PyList_GET_ITEM(seq, i);
+        int overflow;
+        frame_t frame;
+
+        if (!PyLong_CheckExact(item))
+            Py_RETURN_NONE;
+        frame = PyLong_AsLongLongAndOverflow(item, &overflow);
+        if (frame == -1 && PyErr_Occurred())
+            return NULL;
+        if (overflow)
+            Py_RETURN_NONE;
+        if (i == 0 || frame < lo)
+            lo = frame;
+        if (i == 0 || frame > hi)
+            hi = frame;
+        sum += mixFrame((unsigned long long)frame);
+    }
+    return Py_BuildValue("nLLK", n, lo, hi, sum);
+}
+
+/* ------------------------------------------------------------------- */
+
+static PyMethodDef speedupsMethods[] = {
+    {"parseSeqString", parseSeqString, METH_O,
+        "parseSeqString(seqItem) - C version of _parseSeqStringUncached(), or None."},
+    {"expandRanges", expandRanges, METH_O,
+        "expandRanges(frameRanges) - C version of _expandRanges(), or None."},
+    {"condenseFrames", condenseFrames, METH_VARARGS,
+        "condenseFrames(frames, pad, ones) - C version of condenseSeq() for a list of ints, or None."},
+    {"frameFingerprint", frameFingerprint, METH_O,
+        "frameFingerprint(frames) - The condense cache's key for a list of ints, or None."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedupsModule = {
+    PyModuleDef_HEAD_INIT,
+    "seqLister._speedups",
+    "Optional C versions of the kernels of seqLister.",
+    -1,
+    speedupsMethods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedupsModule);
+}
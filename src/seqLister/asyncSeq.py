@@ -0,0 +1,149 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# asyncio versions of expandSeq(), condenseSeq() and condenseSeqOnes()
+# for use from within an event loop, such as a dispatcher service,
+# where one call on a long sequence would otherwise hold up the loop
+# for as long as it takes. For example:
+#
+#     frames = await expandSeqAsync(job.frameSpec)
+#     frameRanges = await condenseSeqAsync(doneFrames, pad=4)
+#
+# Calls on fewer than 'threshold' frames run there and then, with no
+# more overhead than the plain function. Bigger ones either work on
+# the loop in slices of 'sliceSize' frames, handing control back to
+# the loop between slices (expanding), or are handed to 'executor', by
+# default the loop's own pool of threads, and awaited (condensing).
+# Expanding isn't handed to a thread since building the list of
+# frames holds the GIL throughout, and so would hold up the loop just
+# the same, whereas the C speedups let other threads run while they
+# sort and condense. Anything using 'nonSeqList' mustn't look at it
+# until the call has returned.
+#
+# iexpandSeqAsync() is an async iterator over the frames instead,
+# which hands control back to the loop after every 'sliceSize' frames.
+
+import asyncio
+import functools
+import itertools
+
+from . import expandSeq, condenseSeq, condenseSeqOnes, iexpandSeq, \
+    _iterFrameRanges, _iexpandChunks, _frameRange, _ignore, _rejecter
+from .frameSet import FrameSet
+
+# expandSeqAsync() - Returns expandSeq(seqList, nonSeqList, order),
+# built in slices when 'seqList' lists 'threshold' frames or more.
+# The Frame-Ranges are parsed on the loop to count them, which the
+# parse cache makes free for expandSeq() to do again. When 'order' is
+# "sorted" the slices are taken from the runs of a FrameSet, so the
+# Frame-Ranges are all parsed on the loop first.
+#
+async def expandSeqAsync(seqList, nonSeqList=None, order="listed", threshold=100000,
+        sliceSize=100000) :
+    if order not in ("listed", "sorted") :
+        raise ValueError("order must be \"listed\" or \"sorted\", not " + repr(order))
+    if isinstance(seqList, list) and len(seqList) >= threshold :
+        return await _expandInSlices(seqList, nonSeqList, order, sliceSize)
+    if _frameCount(_iterFrameRanges(seqList, _ignore)) >= threshold :
+        return await _expandInSlices(seqList, nonSeqList, order, sliceSize)
+    return expandSeq(seqList, nonSeqList, order)
+
+# _frameCount() - The number of frames in 'frameRanges', as returned
+# by _iterFrameRanges(), counting those listed more than once each time.
+#
+def _frameCount(frameRanges) :
+    return sum([len(_frameRange(start, end, step)) for start, end, step in frameRanges])
+
+async def _expandInSlices(seqList, nonSeqList, order, sliceSize) :
+    if order == "sorted" :
+        chunks = [range(first, last + 1, step)
+            for first, last, step in FrameSet(seqList, nonSeqList).runs()]
+    else :
+        chunks = _iexpandChunks(_iterFrameRanges(seqList, _rejecter(nonSeqList)))
+
+    frames = []
+    room = sliceSize
+    for chunk in chunks :
+        chunk = iter(chunk)
+        while True :
+            before = len(frames)
+            frames.extend(itertools.islice(chunk, room))
+            room -= len(frames) - before
+            if room : # The chunk is used up.
+                break
+            await asyncio.sleep(0)
+            room = sliceSize
+    return frames
+
+# condenseSeqAsync() - Returns condenseSeq(seqList, pad, nonSeqList),
+# run in 'executor' when 'seqList' has 'threshold' items or more.
+#
+async def condenseSeqAsync(seqList, pad=1, nonSeqList=None, threshold=100000, executor=None) :
+    return await _condenseAsync(condenseSeq, seqList, pad, nonSeqList, threshold, executor)
+
+# condenseSeqOnesAsync() - Returns condenseSeqOnes(seqList, pad,
+# nonSeqList), as condenseSeqAsync() above.
+#
+async def condenseSeqOnesAsync(seqList, pad=1, nonSeqList=None, threshold=100000, executor=None) :
+    return await _condenseAsync(condenseSeqOnes, seqList, pad, nonSeqList, threshold, executor)
+
+async def _condenseAsync(condense, seqList, pad, nonSeqList, threshold, executor) :
+    try :
+        small = len(seqList) < threshold
+    except TypeError : # An iterator, which is used up in the executor.
+        small = False
+    if small :
+        return condense(seqList, pad, nonSeqList)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor,
+        functools.partial(condense, seqList, pad, nonSeqList))
+
+# iexpandSeqAsync() - An async iterator over the same frames, in the
+# same order, as iexpandSeq(seqList, onNonSeq), which lets the loop run
+# other tasks after every 'sliceSize' frames. For example:
+#
+#     async for frame in iexpandSeqAsync(job.frameSpec) :
+#         await submitFrame(frame)
+#
+async def iexpandSeqAsync(seqList, onNonSeq=None, sliceSize=10000) :
+    frames = iexpandSeq(seqList, onNonSeq)
+    while True :
+        chunk = list(itertools.islice(frames, sliceSize))
+        if not chunk :
+            return
+        for frameNum in chunk :
+            yield frameNum
+        await asyncio.sleep(0)
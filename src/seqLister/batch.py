@@ -0,0 +1,135 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# Batch versions of expandSeq() and condenseSeq() for running many
+# independent lists at once, such as the frame lists of every shot of
+# a show, spread across a pool of worker processes (or threads):
+#
+#     results = condenseMany(frameListPerShot, pad=4, workers=8)
+#
+# The inputs are sent to the workers in chunks of 'chunksize' lists to
+# keep the cost of passing them between processes low, and the results
+# come back in the same order as the inputs, each as a
+# (result, nonSeqList) tuple so that the rejects of every list are
+# kept apart.
+#
+# As with any use of a process pool, scripts calling these with the
+# default process pool must do so from under an
+# 'if __name__ == "__main__" :' test on platforms which start workers
+# by spawning a new python.
+
+import concurrent.futures
+import functools
+import itertools
+
+from . import expandSeq, condenseSeq, condenseSeqOnes
+
+def _expandChunk(chunk) :
+    results = []
+    for seqList in chunk :
+        nonSeqList = []
+        results.append((expandSeq(seqList, nonSeqList), nonSeqList))
+    return results
+
+def _condenseChunk(chunk, pad, ones) :
+    condense = condenseSeqOnes if ones else condenseSeq
+    results = []
+    for seqList in chunk :
+        nonSeqList = []
+        results.append((condense(seqList, pad, nonSeqList), nonSeqList))
+    return results
+
+def _chunks(seqLists, chunksize) :
+    seqLists = iter(seqLists)
+    while True :
+        chunk = list(itertools.islice(seqLists, chunksize))
+        if not chunk :
+            return
+        yield chunk
+
+# _runChunks() - Runs 'func' on the chunks of 'seqLists', in 'executor'
+# if given, else in a new pool of 'workers' processes (or threads), or
+# right here when 'workers' is 1, and returns the concatenated results
+# in order.
+#
+def _runChunks(func, seqLists, workers, chunksize, threads, executor) :
+    if chunksize < 1 :
+        raise ValueError("chunksize must be at least 1")
+
+    chunks = _chunks(seqLists, chunksize)
+    results = []
+    if executor is None and workers == 1 :
+        for chunk in chunks :
+            results.extend(func(chunk))
+        return results
+
+    if executor is not None :
+        for chunkResults in executor.map(func, chunks) :
+            results.extend(chunkResults)
+        return results
+
+    if threads :
+        pool = concurrent.futures.ThreadPoolExecutor(workers)
+    else :
+        pool = concurrent.futures.ProcessPoolExecutor(workers)
+    with pool :
+        for chunkResults in pool.map(func, chunks) :
+            results.extend(chunkResults)
+    return results
+
+# expandMany() - Returns the list of expandSeq(seqList, nonSeqList) for
+# each 'seqList' of the iterable 'seqLists', in order, as
+# (frames, nonSeqList) tuples.
+#
+# The lists are expanded in a pool of 'workers' processes (by default
+# one per CPU), or threads when 'threads' is True, which is created
+# and shut down for the call, unless an existing
+# concurrent.futures.Executor is passed as 'executor'. With 'workers'
+# equal to 1 the lists are expanded one after the other in the caller.
+#
+def expandMany(seqLists, workers=None, chunksize=64, threads=False, executor=None) :
+    return _runChunks(_expandChunk, seqLists, workers, chunksize, threads, executor)
+
+# condenseMany() - Returns the list of condenseSeq(seqList, pad,
+# nonSeqList), or condenseSeqOnes() when 'ones' is True, for each
+# 'seqList' of the iterable 'seqLists', in order, as
+# (frameRanges, nonSeqList) tuples. The remaining arguments are the
+# same as for expandMany().
+#
+def condenseMany(seqLists, pad=1, ones=False, workers=None, chunksize=64,
+        threads=False, executor=None) :
+    func = functools.partial(_condenseChunk, pad=pad, ones=ones)
+    return _runChunks(func, seqLists, workers, chunksize, threads, executor)
@@ -0,0 +1,148 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# A compact binary format for sets of frames, for storing them or
+# passing them between services without expanding them into lists of
+# ints or reparsing Frame-Range strings. For example:
+#
+#     data = dumps(["1001-1240", "1250-1300x2"])   -> 14 bytes
+#     loads(data)  -> FrameSet('1001-1240,1250-1300x2')
+#
+# The frames are stored as the runs of their FrameSet (see
+# frameSet.py), which are those condenseSeq() builds its Frame-Ranges
+# from, so the size depends on the number of runs and not the number
+# of frames. The format is:
+#
+#     b"SQLB"               - magic number,
+#     version               - one byte, currently 1,
+#     runCount              - varint,
+#
+# followed for each run (first, last, step) by
+#
+#     first                 - zigzag varint for the first run, and
+#                             varint of (first - previous last - 1)
+#                             for the rest,
+#     count - 1             - varint, the frames in the run less one,
+#     step - 1              - varint,
+#
+# where a varint is an unsigned int stored seven bits a byte, lowest
+# first, with the top bit of every byte but the last set, and zigzag
+# maps 0, -1, 1, -2, ... to 0, 1, 2, 3, ... so small negative frames
+# stay small too.
+
+from .frameSet import FrameSet
+
+_magic = b"SQLB"
+_version = 1
+
+def _putVarint(out, n) :
+    while n > 0x7f :
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+# dumps() - Returns the bytes encoding the frames of 'seqList', which
+# may be a FrameSet or anything the FrameSet constructor (and so
+# expandSeq()) accepts. A list of frames is best turned into a
+# FrameSet with FrameSet.fromFrames() first. Items in 'seqList' that
+# aren't Frame-Ranges are appended to the optional list 'nonSeqList'.
+#
+def dumps(seqList, nonSeqList=None) :
+    runs = FrameSet(seqList, nonSeqList).runs()
+
+    out = bytearray(_magic)
+    out.append(_version)
+    _putVarint(out, len(runs))
+    prevLast = None
+    for first, last, step in runs :
+        if prevLast is None :
+            _putVarint(out, first * 2 if first >= 0 else -first * 2 - 1)
+        else :
+            _putVarint(out, first - prevLast - 1)
+        _putVarint(out, (last - first) // step)
+        _putVarint(out, step - 1)
+        prevLast = last
+    return bytes(out)
+
+# loads() - Returns the FrameSet encoded in 'data' by dumps(). 'data'
+# may be bytes or anything else supporting the buffer protocol, such
+# as a bytearray, a memoryview or an mmap.mmap of a file, and is
+# decoded in place without being copied. For example:
+#
+#     with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m :
+#         frames = loads(m)
+#
+# Raises ValueError if 'data' isn't a valid encoding.
+#
+def loads(data) :
+    with memoryview(data) as view, view.cast("B") as view :
+        if view[:len(_magic)] != _magic :
+            raise ValueError("not a seqLister binary frame set")
+        if len(view) <= len(_magic) or view[len(_magic)] != _version :
+            raise ValueError("unsupported seqLister binary frame set version")
+
+        # All the varints, decoded in one pass over the bytes.
+        #
+        values = []
+        n = 0
+        shift = 0
+        for byte in view[len(_magic) + 1:] :
+            if byte < 0x80 :
+                values.append(n | byte << shift)
+                n = 0
+                shift = 0
+            else :
+                n |= (byte & 0x7f) << shift
+                shift += 7
+
+    if shift or not values or len(values) < 1 + 3 * values[0] :
+        raise ValueError("truncated seqLister binary frame set")
+    if len(values) > 1 + 3 * values[0] :
+        raise ValueError("trailing data after seqLister binary frame set")
+
+    runs = []
+    prevLast = None
+    for i in range(1, len(values), 3) :
+        n, count, step = values[i:i+3]
+        if prevLast is None :
+            first = -(n >> 1) - 1 if n & 1 else n >> 1
+        else :
+            first = prevLast + 1 + n
+        step += 1
+        prevLast = first + count * step
+        runs.append((first, prevLast, step))
+
+    return FrameSet._fromRuns(runs)
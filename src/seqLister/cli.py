@@ -0,0 +1,203 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# The seqlister command, for using seqLister from the shell:
+#
+#     seqlister expand 1-10x2 20           -> 1 3 5 7 9 20, one a line
+#     seqlister condense --pad 4 1 2 3 7   -> 0001-0003 and 0007
+#     seqlister condense-ones 0 2 4 5 6    -> 0, 2 and 4-6
+#
+# With no frames or Frame-Ranges on the command line they are read
+# from the standard input, line by line, and expand writes each frame
+# as soon as it has been expanded. Anything that isn't a frame (or a
+# Frame-Range) is reported on the standard error and makes the exit
+# status 1.
+#
+# With --batch every line of the standard input is a separate request
+# and gets exactly one line of output, written (and flushed) as soon as
+# that line has been read, so one long-lived process can answer any
+# number of requests from a shell or Perl co-process:
+#
+#     $ seqlister condense --batch --pad 4
+#     1 2 3 7          (in)
+#     0001-0003 0007   (out)
+#
+# Negative frames and Frame-Ranges, such as -10--5, may be given on the
+# command line like any other, or after a "--" which ends the options.
+
+import argparse
+import itertools
+import os
+import sys
+
+from . import __version__, _iterFrameRanges, _iexpandChunks, _intFrames, condenseSeq, condenseSeqOnes
+from .seqCondenser import SeqCondenser
+
+# Frames are written in slices of this many, so that huge ranges
+# aren't turned into one huge string.
+#
+_writeChunkSize = 4096
+
+# _protectNegatives() - argparse takes any argument starting with "-"
+# as an option, other than plain negative numbers, so negative
+# Frame-Ranges such as -10--5 get a leading space (dropped again when
+# the frames are split on whitespace) to make them positional. Values
+# of the options that take one are left as they are.
+#
+def _protectNegatives(argv) :
+    protected = []
+    for i, arg in enumerate(argv) :
+        if arg == "--" :
+            return protected + argv[i:]
+        if len(arg) > 1 and arg[0] == "-" and arg[1].isdigit() and \
+                (i == 0 or argv[i-1] not in ("--pad", "--sep")) :
+            arg = " " + arg
+        protected.append(arg)
+    return protected
+
+def _parser() :
+    parser = argparse.ArgumentParser(prog="seqlister",
+        description="Expand and condense VFX style frame ranges, such as 1-10x2.")
+    parser.add_argument("--version", action="version", version="%(prog)s " + __version__)
+    subParsers = parser.add_subparsers(dest="command", metavar="command")
+    subParsers.required = True
+
+    for command, help in (
+            ("expand", "list the frames of Frame-Ranges"),
+            ("condense", "condense frames into Frame-Ranges (as condenseSeq())"),
+            ("condense-ones", "condense frames into Frame-Ranges on ones (as condenseSeqOnes())")) :
+        subParser = subParsers.add_parser(command, help=help, description=help)
+        if command != "expand" :
+            subParser.add_argument("--pad", type=int, default=1,
+                help="zero-pad the frames to this many digits")
+        subParser.add_argument("--batch", action="store_true",
+            help="treat each line of the standard input as a separate request, and "
+                "write one line of output for each")
+        subParser.add_argument("--sep", default=None,
+            help="separator between the output frames (or Frame-Ranges), default "
+                "a newline, or a space with --batch")
+        subParser.add_argument("items", nargs="*", metavar="frames",
+            help="frames (or Frame-Ranges for expand), read from the standard "
+                "input if none are given. Negative ones may also follow a '--'")
+    return parser
+
+class _Rejects :
+
+    def __init__(self) :
+        self.count = 0
+
+    def __call__(self, item) :
+        self.count += 1
+        sys.stderr.write("seqlister: ignoring " + repr(item) + "\n")
+
+# _tokens() - Splits a line into its Frame-Ranges, so that just the
+# bad ones are rejected rather than the whole line.
+#
+def _tokens(line) :
+    return line.replace(",", " ").split()
+
+def _writeFrames(out, frameRanges, sep) :
+    first = True
+    for frames in _iexpandChunks(frameRanges) :
+        frames = iter(frames)
+        while True :
+            chunk = [str(f) for f in itertools.islice(frames, _writeChunkSize)]
+            if not chunk :
+                break
+            if not first :
+                out.write(sep)
+            out.write(sep.join(chunk))
+            first = False
+    return not first
+
+def _expand(args, lines, out, reject) :
+    sep = "\n" if args.sep is None else args.sep
+    frameRanges = itertools.chain.from_iterable(
+        _iterFrameRanges(_tokens(line), reject) for line in lines)
+    if _writeFrames(out, frameRanges, sep) :
+        out.write("\n")
+
+def _condense(args, lines, out, reject) :
+    sep = "\n" if args.sep is None else args.sep
+    condenser = SeqCondenser(args.pad, args.command == "condense-ones")
+    for line in lines :
+        for frame in _intFrames((line,), reject) :
+            condenser.add(frame)
+    ranges = condenser.ranges()
+    if ranges :
+        out.write(sep.join(ranges) + "\n")
+
+def _batch(args, lines, out, reject) :
+    sep = " " if args.sep is None else args.sep
+    for line in lines :
+        if args.command == "expand" :
+            _writeFrames(out, _iterFrameRanges(_tokens(line), reject), sep)
+        else :
+            condense = condenseSeqOnes if args.command == "condense-ones" else condenseSeq
+            out.write(sep.join(condense(_intFrames((line,), reject), args.pad)))
+        out.write("\n")
+        out.flush()
+
+def main(argv=None) :
+    if argv is None :
+        argv = sys.argv[1:]
+    args = _parser().parse_args(_protectNegatives(list(argv)))
+
+    if args.items :
+        lines = args.items
+    else :
+        lines = sys.stdin
+
+    reject = _Rejects()
+    try :
+        if args.batch :
+            _batch(args, lines, sys.stdout, reject)
+        elif args.command == "expand" :
+            _expand(args, lines, sys.stdout, reject)
+        else :
+            _condense(args, lines, sys.stdout, reject)
+        sys.stdout.flush()
+    except BrokenPipeError :
+        # The reader went away (e.g. "seqlister expand 1-1000000 | head"),
+        # so stop quietly, and keep python from complaining at exit.
+        #
+        devNull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devNull, sys.stdout.fileno())
+        return 1
+    except KeyboardInterrupt :
+        return 130
+
+    return 1 if reject.count else 0
@@ -0,0 +1,158 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# The condense cache - remembers the results of condenseSeq() and
+# condenseSeqOnes() for a process which is asked to condense the same
+# frames over and over, such as a render farm dashboard redrawing the
+# done and failed frames of every job. It is off unless turned on with
+# seqLister.enableCondenseCache().
+#
+# Results are keyed by a fingerprint of the frames along with 'pad'
+# and 'ones', so the same frames given in any order or as strings
+# share one entry, and a hit skips sorting, removing duplicates and
+# choosing the Frame-Ranges altogether. With the C speedups the
+# fingerprint is the count, lowest, highest and a sum of the mixed
+# frames, made in one pass over the list (before the frames are even
+# turned into ints, when they are all ints already), and a match is
+# checked against the set of frames kept in the entry. Without them,
+# the key is the count and the set of the frames itself. Lists with
+# different numbers of duplicates may be cached separately. Entries are
+# evicted least recently used first once there are more than
+# 'maxEntries' of them or they are estimated to take more than
+# 'maxBytes' of memory. A result bigger than 'maxBytes' on its own
+# isn't kept at all.
+
+import collections
+import sys
+import threading
+
+from . import _speedups, _intFrames
+
+CondenseCacheInfo = collections.namedtuple("CondenseCacheInfo",
+    ["hits", "misses", "maxEntries", "currEntries", "maxBytes", "currBytes"])
+
+# A rough size of an int in the set of frames, beyond the set's own table.
+#
+_intBytes = sys.getsizeof(2**40)
+
+# _fingerprint() - The key of a list of frames, or None when there's
+# no cheap one and the set of the frames is used instead.
+#
+if _speedups is not None :
+    _fingerprint = _speedups.frameFingerprint
+else :
+    def _fingerprint(seqList) :
+        return None
+
+class _CondenseCache :
+
+    def __init__(self, maxEntries, maxBytes) :
+        if maxEntries < 1 :
+            raise ValueError("maxEntries must be at least 1, got " + repr(maxEntries))
+        if maxBytes < 1 :
+            raise ValueError("maxBytes must be at least 1, got " + repr(maxBytes))
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self._entries = collections.OrderedDict() # key -> (result, size, frames)
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) :
+        with self._lock :
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.currBytes = 0
+
+    def info(self) :
+        with self._lock :
+            return CondenseCacheInfo(self.hits, self.misses, self.maxEntries,
+                len(self._entries), self.maxBytes, self.currBytes)
+
+    # condense() - Returns the cached result for the frames in 'seqList'
+    # (as given to condenseSeq(), whose items which aren't frames are
+    # handed to 'reject') or else computes it with condenseInts(frames,
+    # pad, stats, startTime) and caches it. The computing is done
+    # outside the lock, so two threads missing on the same frames at
+    # once both compute it, which is harmless.
+    #
+    def condense(self, seqList, reject, pad, ones, condenseInts, stats, startTime) :
+        frames = None
+        fingerprint = _fingerprint(seqList)
+        if fingerprint is None :
+            frames = _intFrames(seqList, reject)
+            seqList = frames
+            fingerprint = _fingerprint(frames)
+        if fingerprint is None :
+            frameSet = frozenset(frames)
+            key = (len(frames), frameSet, pad, ones)
+        else :
+            frameSet = None
+            key = (fingerprint, pad, ones)
+
+        with self._lock :
+            entry = self._entries.get(key)
+        if entry is not None and (entry[2] is None or entry[2].issuperset(seqList)) :
+            with self._lock :
+                if key in self._entries :
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            return list(entry[0])
+        with self._lock :
+            self.misses += 1
+
+        if frames is None :
+            frames = _intFrames(seqList, reject)
+        # Keep the set of the frames to check later fingerprint matches.
+        #
+        checkSet = frozenset(frames) if frameSet is None else None
+        result = condenseInts(frames, pad, stats, startTime)
+
+        keptSet = frameSet if checkSet is None else checkSet
+        size = sys.getsizeof(keptSet) + _intBytes * len(keptSet) \
+            + sys.getsizeof(result) + sum(map(sys.getsizeof, result))
+        if size > self.maxBytes :
+            return result
+
+        with self._lock :
+            old = self._entries.pop(key, None)
+            if old is not None :
+                self.currBytes -= old[1]
+            self._entries[key] = (tuple(result), size, checkSet)
+            self.currBytes += size
+            while len(self._entries) > self.maxEntries or self.currBytes > self.maxBytes :
+                self.currBytes -= self._entries.popitem(last=False)[1][1]
+        return result
@@ -0,0 +1,177 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# scanDir() - Finds the sequences of numbered files, such as the
+# frames of a render, in a directory and returns them as a list of
+# FileSeqs, one per sequence. For example, for a directory holding
+# shot_v003.1001.exr ... shot_v003.2400.exr and notes.txt,
+#
+#     scanDir("/renders/shot/v003")
+#         returns -> [FileSeq('/renders/shot/v003', 'shot_v003.', '.exr', 4, ['1001-2400'])]
+#
+# A file is part of a sequence when its name is a prefix ending in "."
+# or "_", a (possibly negative) frame number and an optional
+# extension, e.g. "name.0001.exr" or "name_12". Files are grouped into
+# sequences by their directory, prefix, extension and padding. The
+# padding of a zero-padded frame number is its length (e.g. 4 for
+# "0042" and "-001"), and a file whose frame number isn't zero-padded,
+# such as "name.1001.exr", joins the padded sequence of the same name
+# if there is exactly one which it fits (with the same number of
+# digits or more), else it's in a sequence with a padding of 1.
+#
+# Directory entries are read one at a time with os.scandir(), and
+# only the frame numbers (in a SeqCondenser per sequence) are kept, so
+# directories of hundreds of thousands of files are fine. With
+# 'recursive' True, the directories below 'path' are scanned as well,
+# except for symbolic links to directories (which aren't followed, so a
+# link back up the tree can't loop), and like os.walk() a directory
+# below 'path' which can't be read is skipped.
+# The names (with their directory) of the files that aren't part of a
+# sequence are appended to the optional list 'nonSeqList'.
+#
+
+import os
+import re
+
+from . import _rejecter
+from .seqCondenser import SeqCondenser
+
+_fileSeqRE = re.compile(r"(.*[._])(-?\d+)(\.[^.]*)?")
+
+# FileSeq - One sequence of files found by scanDir(). 'directory',
+# 'prefix', 'suffix' (the extension, including the ".", or "") and
+# 'pad' describe the names of the files, and 'frames' is the
+# SeqCondenser of their frame numbers. ranges() returns their
+# Frame-Ranges (see SeqCondenser.ranges()) and str() the usual
+# "prefix.[ranges].ext" shorthand for the whole sequence.
+#
+class FileSeq :
+
+    __slots__ = ("directory", "prefix", "suffix", "pad", "frames")
+
+    def __init__(self, directory, prefix, suffix, pad, ones=False) :
+        self.directory = directory
+        self.prefix = prefix
+        self.suffix = suffix
+        self.pad = pad
+        self.frames = SeqCondenser(pad, ones)
+
+    def ranges(self) :
+        return self.frames.ranges()
+
+    # path() - Returns the path of the file for 'frame'.
+    #
+    def path(self, frame) :
+        return os.path.join(self.directory,
+            self.prefix + "%0*d" % (self.pad, frame) + self.suffix)
+
+    def __str__(self) :
+        return os.path.join(self.directory,
+            self.prefix + "[" + ",".join(self.ranges()) + "]" + self.suffix)
+
+    def __repr__(self) :
+        return "FileSeq(" + ", ".join([repr(self.directory), repr(self.prefix),
+            repr(self.suffix), str(self.pad), repr(self.ranges())]) + ")"
+
+def scanDir(path, recursive=False, ones=False, nonSeqList=None) :
+    reject = _rejecter(nonSeqList)
+
+    fileSeqs = []
+    dirs = [path]
+    while dirs :
+        directory = dirs.pop()
+        try :
+            fileSeqs.extend(_scanOneDir(directory, ones, reject, dirs if recursive else None))
+        except OSError :
+            if directory is path :
+                raise
+
+    fileSeqs.sort(key=lambda fileSeq : (fileSeq.directory, fileSeq.prefix,
+        fileSeq.suffix, fileSeq.pad))
+    return fileSeqs
+
+# _scanOneDir() - Returns the list of FileSeqs in 'directory', and if
+# 'subDirs' isn't None appends the paths of the directories in it
+# (but not of symbolic links to directories) to it.
+#
+def _scanOneDir(directory, ones, reject, subDirs) :
+    padded = {}   # (prefix, suffix, pad) -> FileSeq, for zero-padded frames.
+    unpadded = {} # (prefix, suffix) -> [FileSeq, fewest digits of a frame]
+
+    with os.scandir(directory) as entries :
+        for entry in entries :
+            if entry.is_dir() :
+                if subDirs is not None and not entry.is_symlink() :
+                    subDirs.append(entry.path)
+                continue
+
+            match = _fileSeqRE.fullmatch(entry.name)
+            if match is None :
+                reject(entry.path)
+                continue
+
+            prefix, frameStr, suffix = match.groups("")
+            digits = len(frameStr) - (frameStr[0] == "-")
+            if digits > 1 and frameStr[-digits] == "0" :
+                key = (prefix, suffix, len(frameStr))
+                fileSeq = padded.get(key)
+                if fileSeq is None :
+                    fileSeq = padded[key] = FileSeq(directory, prefix, suffix, len(frameStr), ones)
+            else :
+                key = (prefix, suffix)
+                seqDigits = unpadded.get(key)
+                if seqDigits is None :
+                    seqDigits = unpadded[key] = [FileSeq(directory, prefix, suffix, 1, ones), len(frameStr)]
+                elif len(frameStr) < seqDigits[1] :
+                    seqDigits[1] = len(frameStr)
+                fileSeq = seqDigits[0]
+            fileSeq.frames.add(int(frameStr))
+
+    # Fold each unpadded sequence into the one padded sequence of the
+    # same name whose padding all of its frames fit.
+    #
+    for (prefix, suffix), (fileSeq, fewestDigits) in unpadded.items() :
+        fits = [paddedSeq for paddedSeq in padded.values()
+            if paddedSeq.prefix == prefix and paddedSeq.suffix == suffix
+            and paddedSeq.pad <= fewestDigits]
+        if len(fits) == 1 :
+            for first, last in fileSeq.frames._intervals() :
+                for frame in range(first, last + 1) :
+                    fits[0].frames.add(frame)
+        else :
+            padded[(prefix, suffix, 1)] = fileSeq
+
+    return list(padded.values())
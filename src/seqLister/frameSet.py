@@ -0,0 +1,676 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# FrameSet - an immutable set of frame numbers which is stored as a
+# short tuple of arithmetic runs rather than as individual ints, so
+# that FrameSet("1-10000000") costs a few bytes instead of ten million
+# python ints.
+#
+# A FrameSet can be built from anything expandSeq() accepts,
+#
+#     FrameSet(["1-100", "50-200", 300])
+#     FrameSet("1001-1240x10")
+#
+# or from a list of frames, like those condenseSeq() accepts,
+#
+#     FrameSet.fromFrames([5, 1, 3, 2, 4])
+#
+# and supports len(), "in", iteration (in ascending order), min(),
+# max() and conversion back to a list of Frame-Ranges with condense()
+# and condenseOnes(), none of which expand the set into frames first,
+# for example:
+#
+#     fs = FrameSet("1-10000000")
+#     len(fs)            -> 10000000
+#     5000000 in fs      -> True
+#     fs.condense(pad=4) -> ['0001-10000000']
+#
+# FrameSets also support union(), intersection(), difference() and
+# symmetricDifference() (or the operators |, &, - and ^) which work on
+# the runs directly, for example:
+#
+#     FrameSet("0-1000x4") & FrameSet("0-1000x6") -> FrameSet('0-996x12')
+#     FrameSet("1001-1240") - FrameSet("1001-1100") -> FrameSet('1101-1240')
+#
+# Internally the runs are (first, last, step) tuples, with
+# first <= last and step > 0 (and step == 1 when first == last),
+# sorted and with non-overlapping spans. They are normalized so that
+# each run starts at the first frame not in an earlier run and extends
+# for as long as the step between frames stays the same. As that is
+# unique for a given set of frames, two FrameSets are equal if and
+# only if their runs are.
+
+import bisect
+
+from . import _iterFrameRanges, _intFrames, _gapRun, _condenseGapRuns, _rejecter
+
+class FrameSet :
+
+    __slots__ = ("_runs", "_firsts", "_len")
+
+    def __init__(self, seqList=None, nonSeqList=None) :
+        reject = _rejecter(nonSeqList)
+
+        if seqList is None :
+            runs = ()
+        elif isinstance(seqList, FrameSet) :
+            runs = seqList._runs
+        else :
+            runs = _unionRuns([_ascendingRun(start, end, step)
+                for start, end, step in _iterFrameRanges(seqList, reject)])
+        self._setRuns(runs)
+
+    # _fromFrameRanges() - Returns the FrameSet for an iterable of
+    # (start, end, step) tuples as returned by _iterFrameRanges().
+    #
+    @classmethod
+    def _fromFrameRanges(cls, frameRanges) :
+        frameSet = cls.__new__(cls)
+        frameSet._setRuns(_unionRuns([_ascendingRun(start, end, step)
+            for start, end, step in frameRanges]))
+        return frameSet
+
+    # fromFrames() - Returns the FrameSet of a list of frames, which
+    # can be a mix of ints and strings containing only integers, just
+    # like the lists passed to condenseSeq().
+    #
+    @classmethod
+    def fromFrames(cls, seqList, nonSeqList=None) :
+        reject = _rejecter(nonSeqList)
+
+        frames = sorted(set(_intFrames(seqList, reject)))
+        return cls._fromRuns((n, n, 1) for n in frames)
+
+    # _fromRuns() - Returns the FrameSet for an iterable of sorted
+    # (first, last, step) runs with non-overlapping spans.
+    #
+    @classmethod
+    def _fromRuns(cls, runs) :
+        frameSet = cls.__new__(cls)
+        frameSet._setRuns(_normalizeRuns(runs))
+        return frameSet
+
+    def _setRuns(self, runs) :
+        self._runs = tuple(runs)
+        self._firsts = [run[0] for run in self._runs]
+        self._len = sum([(last - first) // step + 1 for first, last, step in self._runs])
+
+    # runs() - Returns the tuple of (first, last, step) runs that
+    # make up the FrameSet.
+    #
+    def runs(self) :
+        return self._runs
+
+    def __len__(self) :
+        return self._len
+
+    def __bool__(self) :
+        return self._len > 0
+
+    def __contains__(self, frame) :
+        if not isinstance(frame, int) :
+            return False
+        i = bisect.bisect_right(self._firsts, frame) - 1
+        if i < 0 :
+            return False
+        first, last, step = self._runs[i]
+        return frame <= last and (frame - first) % step == 0
+
+    def __iter__(self) :
+        for first, last, step in self._runs :
+            yield from range(first, last + 1, step)
+
+    def __reversed__(self) :
+        for first, last, step in reversed(self._runs) :
+            yield from range(last, first - 1, -step)
+
+    def __eq__(self, other) :
+        if not isinstance(other, FrameSet) :
+            return NotImplemented
+        return self._runs == other._runs
+
+    def __hash__(self) :
+        return hash(self._runs)
+
+    def min(self) :
+        if not self._runs :
+            raise ValueError("min() of an empty FrameSet")
+        return self._runs[0][0]
+
+    def max(self) :
+        if not self._runs :
+            raise ValueError("max() of an empty FrameSet")
+        return self._runs[-1][1]
+
+    # union(), intersection(), difference() and symmetricDifference()
+    # - Return a new FrameSet combining this one and 'other', which
+    # may be a FrameSet or anything the FrameSet constructor accepts.
+    # The cost depends on the number of runs in each FrameSet and not
+    # on the number of frames, except where two stepped runs with
+    # unrelated steps overlap, where the frames of one of them (the
+    # sparser one when possible) are looked at individually.
+    #
+    def union(self, other) :
+        return FrameSet._fromRuns(_combineRuns(self._runs, _asFrameSet(other)._runs, _UNION))
+
+    def intersection(self, other) :
+        return FrameSet._fromRuns(_combineRuns(self._runs, _asFrameSet(other)._runs, _INTERSECTION))
+
+    def difference(self, other) :
+        return FrameSet._fromRuns(_combineRuns(self._runs, _asFrameSet(other)._runs, _DIFFERENCE))
+
+    def symmetricDifference(self, other) :
+        other = _asFrameSet(other)
+        return FrameSet._fromRuns(_combineRuns(
+            _combineRuns(self._runs, other._runs, _DIFFERENCE),
+            _combineRuns(other._runs, self._runs, _DIFFERENCE), _UNION))
+
+    def __or__(self, other) :
+        if not isinstance(other, FrameSet) :
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other) :
+        if not isinstance(other, FrameSet) :
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other) :
+        if not isinstance(other, FrameSet) :
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other) :
+        if not isinstance(other, FrameSet) :
+            return NotImplemented
+        return self.symmetricDifference(other)
+
+    # condense() - Returns the same list of Frame-Ranges as
+    # condenseSeq(list(self), pad) without expanding the set.
+    #
+    def condense(self, pad=1) :
+        formatStr = "%0" + str(pad) + "d"
+        if self._len == 0 :
+            return []
+        if self._len == 1 :
+            return [formatStr % self._runs[0][0]]
+        return _condenseGapRuns(_gapRunsFromRuns(self._runs), formatStr)
+
+    # condenseOnes() - Returns the same list of Frame-Ranges as
+    # condenseSeqOnes(list(self), pad). Only frames in runs with a step
+    # greater than one are looked at individually.
+    #
+    def condenseOnes(self, pad=1) :
+        formatStr = "%0" + str(pad) + "d"
+        condensedList = []
+        firstFrame = None
+        lastFrame = None
+
+        def flush() :
+            if firstFrame == lastFrame :
+                condensedList.append(formatStr % firstFrame)
+            else :
+                condensedList.append(formatStr % firstFrame +"-"+ formatStr % lastFrame)
+
+        for first, last, step in self._runs :
+            if firstFrame is not None and first == lastFrame + 1 :
+                lastFrame = first
+            else :
+                if firstFrame is not None :
+                    flush()
+                firstFrame = lastFrame = first
+            if step == 1 :
+                lastFrame = last
+            elif last != first :
+                flush()
+                for frame in range(first + step, last, step) :
+                    condensedList.append(formatStr % frame)
+                firstFrame = lastFrame = last
+
+        if firstFrame is not None :
+            flush()
+        return condensedList
+
+    def __str__(self) :
+        return ",".join(self.condense())
+
+    def __repr__(self) :
+        return "FrameSet(" + repr(str(self)) + ")"
+
+# normalizeSeq() - Returns the same list of Frame-Ranges as
+# condenseSeq(expandSeq(seqList), pad), or condenseSeqOnes() when
+# 'ones' is True, but by way of a FrameSet, so that overlapping and
+# adjacent Frame-Ranges are merged as runs and the cost depends on
+# the length of 'seqList' rather than on the number of frames (except
+# as noted for FrameSet.union() and FrameSet.condenseOnes()). For
+# example, tidying up a user typed spec:
+#
+#     normalizeSeq("1-100, 50-200, 201-300x1")
+#         returns -> ['1-300']
+#
+# Items in 'seqList' that aren't Frame-Ranges are appended to the
+# optional list 'nonSeqList'.
+#
+def normalizeSeq(seqList, pad=1, ones=False, nonSeqList=None) :
+    frameSet = FrameSet(seqList, nonSeqList)
+    if ones :
+        return frameSet.condenseOnes(pad)
+    return frameSet.condense(pad)
+
+# splitSeq() - Splits the frames of 'seqList', anything expandSeq()
+# accepts or a FrameSet, into chunks for farm tasks, taking the frames
+# in ascending order. Either every chunk has 'chunkSize' frames (but
+# the last, which has what is left), or there are 'chunks' chunks
+# whose sizes differ by at most one frame (fewer if there are fewer
+# frames than that). Exactly one of the two must be given.
+#
+# Returns a list of one string per chunk, holding the condensed
+# Frame-Ranges of its frames (as condenseSeq() with 'pad' would list
+# them) separated by commas. The chunks are cut from the runs of the
+# FrameSet arithmetically, so a stepped Frame-Range stays stepped
+# within each chunk and no frames are expanded. For example:
+#
+#     splitSeq("1001-1100x5", chunkSize=8)
+#         returns -> ['1001-1036x5', '1041-1076x5', '1081-1096x5']
+#
+#     splitSeq("1-10 20-22", chunks=3)
+#         returns -> ['1-5', '6-9', '10,20-22']
+#
+# Items in 'seqList' that aren't Frame-Ranges are appended to the
+# optional list 'nonSeqList'.
+#
+def splitSeq(seqList, chunkSize=None, chunks=None, pad=1, nonSeqList=None) :
+    if (chunkSize is None) == (chunks is None) :
+        raise ValueError("splitSeq() needs exactly one of chunkSize or chunks")
+    count = chunkSize if chunks is None else chunks
+    if not isinstance(count, int) or count < 1 :
+        raise ValueError("chunkSize and chunks must be positive ints, got " + repr(count))
+
+    frameSet = FrameSet(seqList, nonSeqList)
+    total = len(frameSet)
+
+    if chunks is None :
+        sizes = [chunkSize] * (total // chunkSize)
+        if total % chunkSize :
+            sizes.append(total % chunkSize)
+    else :
+        chunks = min(chunks, total)
+        sizes = []
+        if chunks :
+            size, extra = divmod(total, chunks)
+            sizes = [size + 1] * extra + [size] * (chunks - extra)
+
+    chunkList = []
+    runs = iter(frameSet._runs)
+    first = last = step = None
+    for size in sizes :
+        chunkRuns = []
+        while size :
+            if first is None :
+                first, last, step = next(runs)
+            runLen = (last - first) // step + 1
+            if runLen <= size :
+                chunkRuns.append((first, last, step))
+                size -= runLen
+                first = None
+            else :
+                chunkRuns.append((first, first + (size - 1) * step, step))
+                first += size * step
+                size = 0
+        chunkList.append(",".join(FrameSet._fromRuns(chunkRuns).condense(pad)))
+    return chunkList
+
+def _asFrameSet(other) :
+    if isinstance(other, FrameSet) :
+        return other
+    return FrameSet(other)
+
+# _ascendingRun() - Turns a (start, end, step) tuple, as returned by
+# _iterFrameRanges(), into the (first, last, step) run of the same
+# frames in ascending order.
+#
+def _ascendingRun(start, end, step) :
+    if start <= end :
+        first = start
+        last = start + (end - start) // step * step
+    else :
+        first = start - (start - end) // step * step
+        last = start
+    if first == last :
+        step = 1
+    return (first, last, step)
+
+# _normalizeRuns() - Takes an iterable of sorted runs with
+# non-overlapping spans and returns the list of normalized runs
+# describing the same frames (see FrameSet above). Walks the frames
+# from lowest to highest, starting a new run whenever the gap to the
+# next frame changes, but only ever looks at the runs themselves.
+#
+def _normalizeRuns(runs) :
+    result = []
+    curFirst = None
+    curLast = None
+    curStep = None # None while the current run is a single frame.
+
+    for first, last, step in runs :
+        if curFirst is None :
+            curFirst = first
+            curLast = last
+            curStep = step if last != first else None
+            continue
+
+        if curStep is None :
+            # A single frame takes its step from the next frame.
+            curStep = first - curLast
+            curLast = first
+            if last == first :
+                continue
+            first += step
+
+        if first == curLast + curStep :
+            if first == last :
+                curLast = last
+                continue
+            if step == curStep :
+                curLast = last
+                continue
+            curLast = first
+            first += step
+
+        result.append((curFirst, curLast, curStep))
+        curFirst = first
+        curLast = last
+        curStep = step if last != first else None
+
+    if curFirst is not None :
+        result.append((curFirst, curLast, curStep or 1))
+    return result
+
+# _gapRunsFromRuns() - Builds the list of _gapRuns that condenseSeq()
+# would build from the frames in 'runs', which must be normalized.
+#
+def _gapRunsFromRuns(runs) :
+    gapRunList = []
+    prevLast = None
+    for first, last, step in runs :
+        if prevLast is not None :
+            _addGaps(gapRunList, prevLast, first - prevLast, 1)
+        if last != first :
+            _addGaps(gapRunList, first, step, (last - first) // step)
+        prevLast = last
+    gapRunList.append(_gapRun(0, prevLast, 0)) # Add entry for last frame (note zero gapSize)
+    return gapRunList
+
+def _addGaps(gapRunList, startFrame, gapSize, count) :
+    if gapRunList and gapRunList[-1].gapSize == gapSize :
+        gapRunList[-1].seqLen += count
+    else :
+        gapRunList.append(_gapRun(count + 1, startFrame, gapSize))
+
+# _clipRun() - Returns the part of 'run' between 'lo' and 'hi'
+# inclusive, or None if no frames of 'run' are in that interval.
+#
+def _clipRun(run, lo, hi) :
+    first, last, step = run
+    if first < lo :
+        first -= (first - lo) // step * step
+    if last > hi :
+        last = hi
+    if first > last :
+        return None
+    last = first + (last - first) // step * step
+    if first == last :
+        step = 1
+    return (first, last, step)
+
+def _runLen(run) :
+    return (run[1] - run[0]) // run[2] + 1
+
+def _runContains(run, frame) :
+    return run[0] <= frame <= run[1] and (frame - run[0]) % run[2] == 0
+
+# _isSubRun() - True if every frame of 'run' is also in 'other'.
+#
+def _isSubRun(run, other) :
+    if not (other[0] <= run[0] and run[1] <= other[1]) :
+        return False
+    if (run[0] - other[0]) % other[2] != 0 :
+        return False
+    return run[0] == run[1] or run[2] % other[2] == 0
+
+# _extendedGcd() - Returns (g, x, y) such that a*x + b*y == g == gcd(a, b).
+#
+def _extendedGcd(a, b) :
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b :
+        q = a // b
+        a, b = b, a - q * b
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return a, x0, y0
+
+# _intersectRun() - Returns the run of frames in both 'a' and 'b', or
+# None. Frames in both runs are those that solve the two congruences
+# frame = a[0] (mod a[2]) and frame = b[0] (mod b[2]), which repeat
+# every lcm(a[2], b[2]) frames (the chinese remainder theorem).
+#
+def _intersectRun(a, b) :
+    lo = max(a[0], b[0])
+    hi = min(a[1], b[1])
+    if lo > hi :
+        return None
+    g, x, y = _extendedGcd(a[2], b[2])
+    if (b[0] - a[0]) % g != 0 :
+        return None
+    step = a[2] // g * b[2]
+    frame = a[0] + a[2] * ((b[0] - a[0]) // g * x % (b[2] // g))
+    first = lo + (frame - lo) % step
+    if first > hi :
+        return None
+    return _clipRun((first, hi, step), first, hi)
+
+# _unionWindow() - Returns the sorted runs with non-overlapping spans
+# for the union of two runs whose spans are both exactly the same
+# window of frames (so either may have been clipped to it).
+#
+def _unionWindow(a, b) :
+    if a is None :
+        return [] if b is None else [b]
+    if b is None or _isSubRun(b, a) :
+        return [a]
+    if _isSubRun(a, b) :
+        return [b]
+
+    # Two interleaved runs with the same step that fill in each other's gaps.
+    #
+    step = a[2]
+    if b[2] == step and step % 2 == 0 and (b[0] - a[0]) % step == step // 2 :
+        return [(min(a[0], b[0]), max(a[1], b[1]), step // 2)]
+
+    # Otherwise insert the frames of the sparser run into the denser one,
+    # which only costs as much as the sparser run has frames.
+    #
+    if _runLen(a) < _runLen(b) :
+        a, b = b, a
+    result = []
+    lo = a[0]
+    for frame in range(b[0], b[1] + 1, b[2]) :
+        if _runContains(a, frame) :
+            continue
+        piece = _clipRun(a, lo, frame - 1)
+        if piece is not None :
+            result.append(piece)
+        result.append((frame, frame, 1))
+        lo = frame + 1
+    piece = _clipRun(a, lo, a[1])
+    if piece is not None :
+        result.append(piece)
+    return result
+
+# _differenceWindow() - As _unionWindow() but returns the runs of the
+# frames in 'a' that are not in 'b'.
+#
+def _differenceWindow(a, b) :
+    if a is None :
+        return []
+    if b is None :
+        return [a]
+    common = _intersectRun(a, b)
+    if common is None :
+        return [a]
+    if common == a :
+        return []
+
+    # 'common' is a sub-run of 'a' whose step is a multiple of a's step,
+    # so removing it leaves the same number of frames of 'a' between
+    # each of its frames.
+    #
+    step = a[2]
+    result = []
+    if a[0] < common[0] :
+        result.append(_clipRun(a, a[0], common[0] - 1))
+    if common[0] != common[1] :
+        commonStep = common[2]
+        if commonStep == step :
+            pass # Nothing of 'a' left between the frames of 'common'.
+        elif commonStep == 2 * step :
+            result.append(_clipRun((common[0] + step, common[1], commonStep),
+                common[0] + step, common[1]))
+        else :
+            for frame in range(common[0], common[1], commonStep) :
+                result.append(_clipRun(a, frame + 1, frame + commonStep - 1))
+    if common[1] < a[1] :
+        result.append(_clipRun(a, common[1] + 1, a[1]))
+    return result
+
+_UNION = 0
+_INTERSECTION = 1
+_DIFFERENCE = 2
+
+# _combineRuns() - Sweeps through two lists of normalized runs,
+# 'aRuns' and 'bRuns', and returns the normalized runs of their
+# union, intersection or difference (a - b) depending on 'op'.
+# Where runs from both lists overlap, the overlapping window is
+# handled by _unionWindow(), _intersectRun() or _differenceWindow(),
+# otherwise runs are passed through (or dropped) untouched, so the
+# cost depends on the number of runs, not frames.
+#
+def _combineRuns(aRuns, bRuns, op) :
+    result = []
+    aIter = iter(aRuns)
+    bIter = iter(bRuns)
+    a = next(aIter, None)
+    b = next(bIter, None)
+    keepA = op != _INTERSECTION
+    keepB = op == _UNION
+
+    while a is not None or b is not None :
+        if b is None or (a is not None and a[1] < b[0]) :
+            if keepA :
+                result.append(a)
+            a = next(aIter, None)
+            continue
+        if a is None or b[1] < a[0] :
+            if keepB :
+                result.append(b)
+            b = next(bIter, None)
+            continue
+
+        # The spans of 'a' and 'b' overlap between 'lo' and 'hi'.
+        #
+        lo = max(a[0], b[0])
+        hi = min(a[1], b[1])
+
+        if keepA and a[0] < lo :
+            piece = _clipRun(a, a[0], lo - 1)
+            if piece is not None :
+                result.append(piece)
+        if keepB and b[0] < lo :
+            piece = _clipRun(b, b[0], lo - 1)
+            if piece is not None :
+                result.append(piece)
+
+        aWindow = _clipRun(a, lo, hi)
+        bWindow = _clipRun(b, lo, hi)
+        if op == _UNION :
+            result.extend(_unionWindow(aWindow, bWindow))
+        elif op == _INTERSECTION :
+            if aWindow is not None and bWindow is not None :
+                common = _intersectRun(aWindow, bWindow)
+                if common is not None :
+                    result.append(common)
+        else :
+            result.extend(_differenceWindow(aWindow, bWindow))
+
+        a = _clipRun(a, hi + 1, a[1]) if a[1] > hi else None
+        if a is None :
+            a = next(aIter, None)
+        b = _clipRun(b, hi + 1, b[1]) if b[1] > hi else None
+        if b is None :
+            b = next(bIter, None)
+
+    return _normalizeRuns(result)
+
+# _unionRuns() - Returns the normalized runs of the union of a list of
+# runs in any order, each with first <= last. Runs that don't overlap
+# any other run cost nothing extra, clusters of overlapping runs are
+# combined pairwise.
+#
+def _unionRuns(runs) :
+    runs.sort()
+    result = []
+    cluster = []
+    clusterLast = None
+    for run in runs :
+        if cluster and run[0] > clusterLast :
+            result.extend(_unionCluster(cluster))
+            cluster = []
+        if not cluster or run[1] > clusterLast :
+            clusterLast = run[1]
+        cluster.append(run)
+    if cluster :
+        result.extend(_unionCluster(cluster))
+    return _normalizeRuns(result)
+
+def _unionCluster(cluster) :
+    runLists = [[run] for run in cluster]
+    while len(runLists) > 1 :
+        merged = [_combineRuns(runLists[i], runLists[i+1], _UNION)
+            for i in range(0, len(runLists) - 1, 2)]
+        if len(runLists) % 2 :
+            merged.append(runLists[-1])
+        runLists = merged
+    return runLists[0]
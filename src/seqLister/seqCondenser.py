@@ -0,0 +1,242 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2008-2026, James Philip Rowell,
+# Alpha Eleven Incorporated
+# www.alpha-eleven.com
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+#   - Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#
+#   - Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in
+#     the documentation and/or other materials provided with the
+#     distribution.
+#
+#   - Neither the name of "Alpha Eleven, Inc."  nor the names of its
+#     contributors may be used to endorse or promote products derived
+#     from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT
+# HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+# SeqCondenser - condenses frames into Frame-Ranges as they arrive,
+# rather than all at once like condenseSeq(). For example, a render
+# monitor which is told about finished frames one at a time,
+#
+#     done = SeqCondenser(pad=4)
+#     for frame in finishedFrames() :
+#         done.add(frame)
+#         print(done.ranges())
+#
+# The frames are kept as a sorted list of intervals of successive
+# frames, split into blocks of a few hundred intervals so that add()
+# only has to bisect to the interval before the frame and then extend,
+# join or insert one interval within one short block. ranges() works
+# on the intervals rather than on the frames. It returns the same list
+# as condenseSeq() would for all the frames added so far, or
+# condenseSeqOnes() when 'ones' is True.
+
+import bisect
+
+from . import _iterFrameRanges, _intFrames, _condenseGapRuns, _rejecter
+from .frameSet import FrameSet, _gapRunsFromRuns
+
+# Blocks are split in two when they grow past twice this many intervals.
+#
+_blockSize = 512
+
+class SeqCondenser :
+
+    __slots__ = ("pad", "ones", "_blocks", "_firsts", "_len", "_ranges")
+
+    def __init__(self, pad=1, ones=False) :
+        self.pad = pad
+        self.ones = ones
+        self._blocks = [] # [starts, ends] lists of intervals, in order.
+        self._firsts = [] # The first start of each block.
+        self._len = 0
+        self._ranges = None # ranges() as of the last add(), or None.
+
+    # _locate() - Returns (b, i) such that interval i of block b is the
+    # first to start after 'frame' (i may be the length of the block),
+    # so that i > 0 unless 'frame' comes before every interval.
+    #
+    def _locate(self, frame) :
+        b = bisect.bisect_right(self._firsts, frame) - 1
+        if b < 0 :
+            b = 0
+        return b, bisect.bisect_right(self._blocks[b][0], frame)
+
+    def _intervals(self) :
+        for starts, ends in self._blocks :
+            yield from zip(starts, ends)
+
+    # add() - Adds the int 'frame'. Adding a frame more than once is
+    # harmless.
+    #
+    def add(self, frame) :
+        if not isinstance(frame, int) :
+            raise TypeError("SeqCondenser.add() expects an int, not " + repr(frame))
+
+        if not self._blocks :
+            self._blocks.append([[frame], [frame]])
+            self._firsts.append(frame)
+            self._len = 1
+            self._ranges = None
+            return
+
+        blocks = self._blocks
+        b, i = self._locate(frame)
+        starts, ends = blocks[b]
+        if i > 0 and frame <= ends[i-1] :
+            return
+
+        # The interval after 'frame' may be the first of the next block.
+        #
+        if i < len(starts) :
+            nextB, nextI = b, i
+        elif b + 1 < len(blocks) :
+            nextB, nextI = b + 1, 0
+        else :
+            nextB = None
+
+        joinPrev = i > 0 and ends[i-1] == frame - 1
+        joinNext = nextB is not None and blocks[nextB][0][nextI] == frame + 1
+        if joinPrev and joinNext :
+            ends[i-1] = blocks[nextB][1][nextI]
+            self._delete(nextB, nextI)
+        elif joinPrev :
+            ends[i-1] = frame
+        elif joinNext :
+            blocks[nextB][0][nextI] = frame
+            if nextI == 0 :
+                self._firsts[nextB] = frame
+        else :
+            starts.insert(i, frame)
+            ends.insert(i, frame)
+            if i == 0 :
+                self._firsts[b] = frame
+            if len(starts) > 2 * _blockSize :
+                blocks.insert(b + 1, [starts[_blockSize:], ends[_blockSize:]])
+                self._firsts.insert(b + 1, starts[_blockSize])
+                del starts[_blockSize:]
+                del ends[_blockSize:]
+
+        self._len += 1
+        self._ranges = None
+
+    def _delete(self, b, i) :
+        starts, ends = self._blocks[b]
+        del starts[i]
+        del ends[i]
+        if not starts :
+            del self._blocks[b]
+            del self._firsts[b]
+        elif i == 0 :
+            self._firsts[b] = starts[0]
+
+    # addMany() - Adds a list of frames, which can be a mix of ints and
+    # strings containing only integers, just like the lists passed to
+    # condenseSeq(). Anything else is appended to the optional list
+    # 'nonSeqList'.
+    #
+    def addMany(self, frames, nonSeqList=None) :
+        reject = _rejecter(nonSeqList)
+
+        for frame in _intFrames(frames, reject) :
+            self.add(frame)
+
+    # ranges() - Returns the list of Frame-Ranges of the frames added
+    # so far, as condenseSeq() (or condenseSeqOnes() when 'ones' is
+    # True) would, zero-padded to 'pad'.
+    #
+    def ranges(self) :
+        if self._ranges is None :
+            formatStr = "%0" + str(self.pad) + "d"
+            if not self._blocks :
+                self._ranges = []
+            elif self.ones or self._len == 1 :
+                self._ranges = [formatStr % first if first == last
+                    else formatStr % first + "-" + formatStr % last
+                    for first, last in self._intervals()]
+            else :
+                runs = [(first, last, 1) for first, last in self._intervals()]
+                self._ranges = _condenseGapRuns(_gapRunsFromRuns(runs), formatStr)
+        return list(self._ranges)
+
+    # frameSet() - Returns the FrameSet of the frames added so far.
+    #
+    def frameSet(self) :
+        return FrameSet._fromRuns([(first, last, 1) for first, last in self._intervals()])
+
+    def __len__(self) :
+        return self._len
+
+    def __contains__(self, frame) :
+        if not self._blocks :
+            return False
+        b, i = self._locate(frame)
+        return i > 0 and frame <= self._blocks[b][1][i-1]
+
+    def __repr__(self) :
+        return "SeqCondenser(" + repr(self.ranges()) + ")"
+
+# missingFrames() - Returns the Frame-Ranges of the frames of
+# 'expectedSpec', anything expandSeq() accepts, which aren't in
+# 'presentFrames', condensed as condenseSeq() (or condenseSeqOnes()
+# when 'ones' is True) would, zero-padded to 'pad'. For example:
+#
+#     missingFrames("1001-1240", [1001, 1002, 1003, 1010])
+#         returns -> ['1004-1009', '1011-1240']
+#
+# 'presentFrames' may be any iterable of frames, like the lists
+# condenseSeq() accepts, and is read one frame at a time, so it can be
+# a generator streaming them from a directory listing; or it may be a
+# FrameSet or SeqCondenser (such as the 'frames' of a FileSeq). Only
+# the present frames that are expected are kept, as intervals, and
+# the expected frames are never expanded, so the cost grows with the
+# number of runs and gaps rather than with the number of frames.
+# Items of 'expectedSpec' that aren't Frame-Ranges and of
+# 'presentFrames' that aren't frames are appended to the optional list
+# 'nonSeqList'.
+#
+def missingFrames(expectedSpec, presentFrames, pad=1, ones=False, nonSeqList=None) :
+    reject = _rejecter(nonSeqList)
+
+    expected = FrameSet._fromFrameRanges(_iterFrameRanges(expectedSpec, reject))
+
+    if isinstance(presentFrames, SeqCondenser) :
+        present = presentFrames.frameSet()
+    elif isinstance(presentFrames, FrameSet) :
+        present = presentFrames
+    else :
+        condenser = SeqCondenser()
+        for frame in presentFrames :
+            if isinstance(frame, int) :
+                if frame in expected :
+                    condenser.add(frame)
+            else :
+                for frame in _intFrames((frame,), reject) :
+                    if frame in expected :
+                        condenser.add(frame)
+        present = condenser.frameSet()
+
+    missing = expected - present
+    if ones :
+        return missing.condenseOnes(pad)
+    return missing.condense(pad)
@@ -0,0 +1,118 @@
+# Checks that "import seqLister" stays cheap, as it's imported at the
+# start of every farm task. Run from the tests directory,
+#
+#     python3 testImportTime.py [--max-ratio R | --budget-ms N] [--strict]
+#
+# It imports seqLister in a fresh python a few times with
+# "python3 -X importtime", and fails (exit status 1) if importing it
+# pulled in any of the modules that are only meant to be loaded when
+# first used.
+#
+# It also reports the median cumulative import time of seqLister
+# against a budget, by default a fraction ('--max-ratio') of the median
+# time taken to start a bare "python3 -c pass" on the same machine, or
+# else a fixed number of milliseconds given with '--budget-ms'. Timings
+# on a loaded machine are too noisy to fail on, so going over the
+# budget only prints a warning, unless '--strict' is given.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Modules "import seqLister" must not import.
+#
+lazyModules = [
+    "seqLister.frameSet",
+    "seqLister.seqCondenser",
+    "seqLister.batch",
+    "seqLister.fileSeq",
+    "seqLister.cli",
+    "seqLister._numpyBackend",
+    "seqLister.condenseCache",
+    "seqLister.asyncSeq",
+    "seqLister.binarySeq",
+    "concurrent.futures",
+    "asyncio",
+    "re",
+    "numpy",
+]
+
+def runPython(code) :
+    env = dict(os.environ)
+    env["PYTHONPATH"] = srcDir + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("PYTHONDONTWRITEBYTECODE", None) # Time loading the .pyc, as when installed.
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+# startupTime() - The median wall clock time, in microseconds, of
+# 'runs' starts of a bare python.
+#
+def startupTime(runs) :
+    times = []
+    for i in range(runs) :
+        startTime = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append((time.perf_counter() - startTime) * 1e6)
+    return statistics.median(times)
+
+# importTime() - The cumulative import time of seqLister in microseconds,
+# from the "-X importtime" report "import time: self | cumulative | name".
+#
+def importTime(report) :
+    for line in report.splitlines() :
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "seqLister" :
+            return int(fields[1])
+    raise RuntimeError("seqLister not found in the -X importtime report")
+
+def main() :
+    parser = argparse.ArgumentParser(description="Check the import time of seqLister.")
+    parser.add_argument("--max-ratio", type=float, default=1.0,
+        help="most 'import seqLister' may take as a fraction of the time "
+        "to start a bare python (default 1.0)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+        help="most milliseconds 'import seqLister' may take, instead of --max-ratio")
+    parser.add_argument("--strict", action="store_true",
+        help="fail when over the budget, rather than only warning")
+    parser.add_argument("--runs", type=int, default=9)
+    args = parser.parse_args()
+
+    code = "import sys, seqLister; print(' '.join(sorted(sys.modules)))"
+    runPython(code) # Compile the .pyc files first.
+    times = []
+    for i in range(args.runs) :
+        result = runPython(code)
+        times.append(importTime(result.stderr))
+    median = statistics.median(times)
+    loaded = set(result.stdout.split())
+
+    if args.budget_ms is None :
+        startup = startupTime(args.runs)
+        budget = args.max_ratio * startup
+        print("python startup: %.1f ms" % (startup / 1000.0))
+    else :
+        budget = args.budget_ms * 1000
+
+    failed = False
+    print("import seqLister: %.1f ms (budget %.1f ms)" % (median / 1000.0, budget / 1000.0))
+    if median > budget :
+        if args.strict :
+            print("FAILED: over budget")
+            failed = True
+        else :
+            print("WARNING: over budget")
+    for name in lazyModules :
+        if name in loaded :
+            print("FAILED: import seqLister imported " + name)
+            failed = True
+    if not failed :
+        print("ok")
+    return 1 if failed else 0
+
+if __name__ == "__main__" :
+    sys.exit(main())
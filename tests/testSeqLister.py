@@ -1,4 +1,11 @@
 import seqLister
+from array import array
+import concurrent.futures
+import io
+import os
+import shutil
+import sys
+import tempfile
 
 badArgs = []
 print("seqLister version: ", seqLister.__version__)
@@ -70,6 +77,64 @@ print("badArgs: ", badArgs)
 print(seqLister.expandSeq(["1-5", "8-a"], badArgs)) # partially invalid
 print("badArgs: ", badArgs)
 print(seqLister.expandSeq(['20-10x3']))
+print(seqLister.expandSeq("1-10x2 20-30")) # step must not carry over to 20-30
+print(seqLister.expandSeq(["1-5x0", "7-7x0"], badArgs)) # invalid, then just 7
+print("badArgs: ", badArgs)
+print(seqLister.expandSeq(["10-20", "15-25", 12, "30-40x5", "40-30x2", "1-40x3"]))
+tmpList = seqLister.expandSeq(["1-200000", "100000-300000"])
+print(len(tmpList), tmpList[:3], tmpList[-3:])
+
+print("")
+print("Testing iexpandSeq()")
+print("")
+badArgs.clear()
+print(list(seqLister.iexpandSeq(["1-4", "a-b", "3-6"], badArgs.append)))
+print("badArgs: ", badArgs)
+print(list(seqLister.iexpandSeq(["0-16x8", "0-16x2"])))
+print(list(seqLister.iexpandSeq(["0-64x64", "0-64x32", "0-64x16", "0-64x8", "0-64x4", "0-64x2", "0-64"])))
+print(list(seqLister.iexpandSeq(["10-20", "15-25", 12, "30-40x5", "40-30x2", "1-40x3"])))
+print(list(seqLister.iexpandSeq("5--2")))
+print(list(seqLister.iexpandSeq(["3-5", "10-12", "1-15", "14-0x3", "4-12", "1-15x2", "30-20x2"])))
+print(sum(1 for frame in seqLister.iexpandSeq(["1-200000"] * 200 + ["%d-%d" % (i, i + 200000) for i in range(0, 20000, 100)])))
+tmpIter = seqLister.iexpandSeq("1-10000000000")
+print(next(tmpIter), next(tmpIter), next(tmpIter))
+
+print("")
+print("Testing expandSeqArray()")
+print("")
+print(seqLister.expandSeqArray(["1-5", "3-8x2"]))
+print(seqLister.expandSeqArray(["0-16x8", "0-16x2", "a-b"], badArgs))
+print("badArgs: ", badArgs)
+print(seqLister.expandSeqArray("5--2"), seqLister.expandSeqArray([]))
+tmpArray = seqLister.expandSeqArray(["1-200000", "100000-300000"])
+print(len(tmpArray), tmpArray.itemsize, tmpArray[:3], tmpArray[-3:])
+for asNumpy in (False, True) :
+    try :
+        seqLister.expandSeqArray(["9223372036854775800-9223372036854775810"], asNumpy=asNumpy)
+    except OverflowError as e :
+        print("OverflowError:", e)
+    except ImportError :
+        print("OverflowError: int too big to convert") # No NumPy here.
+print(seqLister.expandSeqArray(["10-20", "15-25", 12, "30-40x5", "40-30x2", "1-40x3"]).tolist() == seqLister.expandSeq(["10-20", "15-25", 12, "30-40x5", "40-30x2", "1-40x3"]))
+
+print("")
+print("Testing parse cache and compileSeq()")
+print("")
+seqLister.clearParseCache()
+for i in range(3) :
+    seqLister.expandSeq(["1001-1240", "1001-1240x10", "a-b"])
+print(seqLister.parseCacheInfo())
+seqLister.setParseCacheSize(2)
+seqLister.expandSeq(["1", "2", "3", "1"])
+print(seqLister.parseCacheInfo())
+seqLister.setParseCacheSize(1024)
+print(seqLister.parseCacheInfo())
+compiledSeq = seqLister.compileSeq(["0-16x8", "0-16x2", "a-b", 20], badArgs)
+print(compiledSeq.expand(), compiledSeq.nonSeqList)
+print("badArgs: ", badArgs)
+print(list(compiledSeq.iexpand()), compiledSeq.expandArray(), compiledSeq.frameSet())
+print(compiledSeq.expand() == seqLister.expandSeq(["0-16x8", "0-16x2", "a-b", 20]))
+print(compiledSeq)
 
 print("")
 print("Testing condenseSeq()")
@@ -172,3 +237,318 @@ print(seqLister.condenseSeqOnes(['-10, -9', '-8,,  , -7', '-5', '-4 -3', -2, '-1
 print(seqLister.condenseSeqOnes([2, 1, 3, 7, 8, 4, 5, 6, 9, 10]))
 print(seqLister.condenseSeqOnes([0, 8, 16, 2, 4, 6, 10, 12, 14]))
 print(seqLister.condenseSeqOnes([0, 8, 16, 2, 4, 6, 10, 12, 13, 14]))
+
+# Arrays of ints, condensed with NumPy when it's installed.
+print(seqLister.condenseSeq(array("q", [0, 8, 16, 2, 4, 6, 10, 12, 14, 14, 51, -3]), nonSeqList=badArgs))
+print("badArgs: ", badArgs)
+print(seqLister.condenseSeqOnes(array("i", [0, 8, 16, 2, 4, 6, 10, 12, 13, 14, 14])))
+print(seqLister.condenseSeq(array("H", [97, 98, 99, 100, 101, 102, 103]), pad=4))
+print(seqLister.condenseSeq(array("q", seqLister.expandSeq(["2-50x2", "3-50x3", "5-50x5", "7-50x7", "11-50x11", "13-50x13", "17-50x17", "19-50x19", "23-50x23"]))))
+print(seqLister.condenseSeq(array("q")), seqLister.condenseSeq(array("q", [7])), seqLister.condenseSeqOnes(array("b", [-2])))
+print(seqLister.condenseSeq(array("b", [-100, 100, 110])), seqLister.condenseSeq(array("h", [-32768, 32767, -1, 0, 1, 3])))
+print(seqLister.condenseSeqOnes(array("b", [-128, 127, -1, 0, 1])), seqLister.condenseSeqOnes(array("h", [-32768, 32767, 32766, 0, -1])))
+print(seqLister.condenseSeq(array("B", [255, 0, 1, 2])), seqLister.condenseSeq(array("q", [-(1 << 62), 1 << 62])))
+print(seqLister.condenseSeq(array("Q", [0, (1 << 64) - 3, (1 << 64) - 1])))
+with seqLister.collectStats() as stats :
+    seqLister.condenseSeq(array("b", [1, 2, 3]))
+print(stats.condenseCalls)
+
+print("")
+print("Testing FrameSet")
+print("")
+fs = seqLister.FrameSet("1-10000000")
+print(len(fs), fs.runs(), 5000000 in fs, 0 in fs, fs.min(), fs.max())
+print(fs.condense(pad=4), fs.condenseOnes())
+fs = seqLister.FrameSet(["0-1000000x2", "1-1000000x2"])
+print(len(fs), fs.runs(), fs)
+fs = seqLister.FrameSet(["1-10", "a-b", "5-20", 30, "40-30x5"], badArgs)
+print(repr(fs), len(fs), list(fs))
+print("badArgs: ", badArgs)
+fs = seqLister.FrameSet(["0-100x2", 51])
+print(fs.runs(), fs.condense(), fs.condenseOnes())
+fs = seqLister.FrameSet(["0-64x64", "0-64x32", "0-64x16", "0-64x8", "0-64x4", "0-64x2", "0-64"])
+print(fs.runs(), fs.condense())
+fs = seqLister.FrameSet(["2-50x2", "3-50x3", "5-50x5", "7-50x7", "11-50x11", "13-50x13", "17-50x17", "19-50x19", "23-50x23"])
+print(fs.condense())
+print(fs.condense() == seqLister.condenseSeq(seqLister.expandSeq(["2-50x2", "3-50x3", "5-50x5", "7-50x7", "11-50x11", "13-50x13", "17-50x17", "19-50x19", "23-50x23"])))
+print(fs.condenseOnes() == seqLister.condenseSeqOnes(list(fs)))
+print(list(reversed(seqLister.FrameSet("-3-3x2"))))
+print(seqLister.FrameSet.fromFrames([5, "1", 3, "2 4", "x"], badArgs).runs())
+print("badArgs: ", badArgs)
+print(seqLister.FrameSet("1-5") == seqLister.FrameSet.fromFrames([1, 2, 3, 4, 5]))
+print(seqLister.FrameSet(), len(seqLister.FrameSet()), bool(seqLister.FrameSet()))
+
+print("")
+print("Testing FrameSet set algebra")
+print("")
+fsA = seqLister.FrameSet("0-1000x4")
+fsB = seqLister.FrameSet("0-1000x6")
+print(fsA & fsB, fsA.intersection("0-1000x6"))
+print(len(fsA | fsB), (fsA | fsB) == seqLister.FrameSet.fromFrames(set(fsA) | set(fsB)))
+print(len(fsA - fsB), (fsA - fsB) == seqLister.FrameSet.fromFrames(set(fsA) - set(fsB)))
+print(len(fsA ^ fsB), (fsA ^ fsB) == seqLister.FrameSet.fromFrames(set(fsA) ^ set(fsB)))
+print(seqLister.FrameSet("1001-1240") - seqLister.FrameSet("1001-1100"))
+print(seqLister.FrameSet("1-100").difference(["10-20", "50-100x2"]))
+print(seqLister.FrameSet("1-10").union("5-15 20"), seqLister.FrameSet("1-10").symmetricDifference("5-15"))
+print(seqLister.FrameSet("0-100000000x4") & seqLister.FrameSet("0-100000000x6"))
+print(seqLister.FrameSet("0-100000000") - seqLister.FrameSet("0-100000000x2"))
+print(seqLister.FrameSet("1-10") & seqLister.FrameSet("20-30"), len(seqLister.FrameSet("1-10") & seqLister.FrameSet("20-30")))
+
+print("")
+print("Testing parseSeq")
+print("")
+print(seqLister.parseSeq("1-10, 20-10x-5 7"))
+print(seqLister.parseSeq(["-10--3x2", 4, "5-5x0", "-4", "1-3x-1"]))
+for seqList in ["1-10 1-6x2- 7", "1-10,,a-b", ["1-2", 3.5], "10-1x0", "1--", "1-4x"] :
+    try :
+        seqLister.parseSeq(seqList)
+    except seqLister.SeqParseError as e :
+        print(e, "|", repr(e.item), repr(e.token), e.pos, isinstance(e, ValueError))
+
+print("")
+print("Testing SeqCondenser")
+print("")
+condenser = seqLister.SeqCondenser()
+condenserOnes = seqLister.SeqCondenser(pad=3, ones=True)
+print(condenser.ranges(), len(condenser), 1 in condenser)
+for f in [0, 8, 16, 2, 4, 6, 10, 12, 14, 8, 13] :
+    condenser.add(f)
+    condenserOnes.add(f)
+    print(condenser.ranges(), condenserOnes.ranges())
+print(len(condenser), 13 in condenser, 15 in condenser, condenser)
+condenser.addMany(["51", 100, "x", "1 3"], badArgs)
+print(condenser.ranges(), condenser.frameSet())
+print("badArgs: ", badArgs)
+print(condenser.ranges() == seqLister.condenseSeq([0, 8, 16, 2, 4, 6, 10, 12, 14, 13, 51, 100, 1, 3]))
+try :
+    condenser.add("7")
+except TypeError as e :
+    print(e)
+
+print("")
+print("Testing expandMany and condenseMany")
+print("")
+print(seqLister.expandMany([["1-4", "a-b"], "10-1x3", [], [5, 5]], workers=1))
+print(seqLister.condenseMany([[2, 1, 3, "x"], ["0 8 16 2 4 6 10 12 14"], [97, 98, 103]], pad=3,
+    workers=2, chunksize=2, threads=True))
+print(seqLister.condenseMany([[0, 8, 16, 2, 4, 6, 10, 12, 13, 14]], ones=True, workers=1))
+
+print("")
+print("Testing expandSeqResult, condenseSeqResult and condenseSeqOnesResult")
+print("")
+print(seqLister.expandSeqResult(["1-3", "a-b", 5]))
+frames, rejects = seqLister.expandSeqResult("1-3")
+print(frames, rejects, rejects == ())
+print(seqLister.condenseSeqResult([2, 1, 3, "x", 5], pad=2))
+print(seqLister.condenseSeqOnesResult(["0 8 16 2 4 6", "a", 10, 12, 13, 14]))
+print(seqLister.condenseSeqResult([1, 2, 3]) == seqLister.SeqResult(['1-3']))
+print(seqLister.expandSeq(["1-3", "a-b"]), seqLister.condenseSeq([1, 2, "c"]))
+
+def threadedResults(i) :
+    return seqLister.condenseSeqResult([i, i+1, "bad%d" % i]) == seqLister.SeqResult(["%d-%d" % (i, i+1)], ("bad%d" % i,))
+with concurrent.futures.ThreadPoolExecutor(8) as pool :
+    print(all(pool.map(threadedResults, range(2000))))
+
+print("")
+print("Testing scanDir")
+print("")
+scanRoot = tempfile.mkdtemp()
+os.mkdir(os.path.join(scanRoot, "sub"))
+for name in ["shot_v003.%04d.exr" % f for f in range(1, 1201) if f != 600] + \
+        ["notes.txt", "a.9.exr", "a.10.exr", "b_-001.dpx", "b_0000.dpx", "b_0003.dpx",
+         "c.1.tif", "c.01.tif", os.path.join("sub", "x.0001.exr")] :
+    open(os.path.join(scanRoot, name), "w").close()
+for fileSeq in seqLister.scanDir(scanRoot, nonSeqList=badArgs) :
+    print(fileSeq.prefix, fileSeq.suffix, fileSeq.pad, fileSeq.ranges(), os.path.relpath(str(fileSeq), scanRoot))
+print("badArgs: ", [os.path.relpath(path, scanRoot) for path in badArgs])
+print([os.path.relpath(str(fileSeq), scanRoot) for fileSeq in seqLister.scanDir(scanRoot, recursive=True, ones=True)])
+print(os.path.relpath(seqLister.scanDir(scanRoot)[-1].path(42), scanRoot))
+os.symlink(scanRoot, os.path.join(scanRoot, "sub", "loop"))
+os.mkdir(os.path.join(scanRoot, "locked"))
+open(os.path.join(scanRoot, "locked", "y.0001.exr"), "w").close()
+os.chmod(os.path.join(scanRoot, "locked"), 0)
+realScandir = os.scandir
+def lockedScandir(directory) :
+    # Running as root ignores the permissions, so refuse "locked" here too.
+    if os.path.basename(directory) == "locked" :
+        raise PermissionError(13, "Permission denied", directory)
+    return realScandir(directory)
+os.scandir = lockedScandir
+try :
+    print([os.path.relpath(str(fileSeq), scanRoot) for fileSeq in seqLister.scanDir(scanRoot, recursive=True)])
+    try :
+        seqLister.scanDir(os.path.join(scanRoot, "locked"))
+    except PermissionError as e :
+        print("PermissionError", e.errno)
+finally :
+    os.scandir = realScandir
+    os.chmod(os.path.join(scanRoot, "locked"), 0o755)
+shutil.rmtree(scanRoot)
+
+print("")
+print("Testing missingFrames")
+print("")
+print(seqLister.missingFrames("1001-1240", [1001, 1002, 1003, 1010]))
+print(seqLister.missingFrames("1-1000000", (f for f in range(1, 1000001) if f % 1000 != 7), pad=4))
+print(seqLister.missingFrames(["0-100x2", "a-b"], ["0 2 4", 50, "x", 51, 200], ones=True, nonSeqList=badArgs))
+print("badArgs: ", badArgs)
+print(seqLister.missingFrames("1-10000000", seqLister.FrameSet("1-5000000 5000002-10000000")))
+condenser = seqLister.SeqCondenser()
+condenser.addMany([1, 2, 3, 9])
+print(seqLister.missingFrames("1-10", condenser), seqLister.missingFrames("1-10", range(1, 11)))
+
+print("")
+print("Testing the seqlister command")
+print("")
+import seqLister.cli
+print(seqLister.cli.main(["expand", "1-10x3", "5-1x2"]))
+print(seqLister.cli.main(["expand", "--sep", ",", "1-4", "3-6"]))
+print(seqLister.cli.main(["condense", "--pad", "4", "1", "2", "3 7"]))
+print(seqLister.cli.main(["condense-ones", "--sep", ",", "0", "2", "4", "5", "6"]))
+print(seqLister.cli.main(["expand", "-5-5x3", "-2", "-10--8"]))
+print(seqLister.cli.main(["condense", "--pad", "2", "-5", "-4", "-3,-1", "7"]))
+print(seqLister.cli.main(["expand", "--sep", ",", "--", "-3--1", "-7"]))
+stdin = sys.stdin
+sys.stdin = io.StringIO("1-3\n5-1x2 9\n\n")
+print(seqLister.cli.main(["expand", "--batch"]))
+sys.stdin = io.StringIO("1 2 3 7\n0,2,4,6,8\n")
+print(seqLister.cli.main(["condense", "--batch", "--pad", "2"]))
+sys.stdin = io.StringIO("1 2 3\n7\n8\n")
+print(seqLister.cli.main(["condense"]))
+sys.stdin = stdin
+
+print("")
+print("Testing SeqStats")
+print("")
+with seqLister.collectStats() as stats :
+    seqLister.expandSeq(["1-10", "5-15", "x", "20-30x2"])
+    seqLister.condenseSeq([1, 2, 3, 3, 5, 7, 9, 10])
+    seqLister.condenseSeqOnes([1, 1, 2])
+print({name : value for name, value in stats.asDict().items() if not name.endswith("Seconds")})
+print(stats.parseSeconds > 0, stats.selectSeconds > 0, seqLister._activeStats)
+globalStats = seqLister.enableStats()
+seqLister.condenseSeq([1, 2])
+seqLister.disableStats()
+seqLister.condenseSeq([1, 2])
+print(globalStats.condenseCalls, globalStats.expandCalls)
+globalStats.reset()
+print(globalStats.condenseCalls, globalStats.dedupSeconds)
+globalStats = seqLister.enableStats()
+with seqLister.collectStats() as outerStats :
+    with seqLister.collectStats() as innerStats :
+        seqLister.condenseSeq([1, 2])
+        with concurrent.futures.ThreadPoolExecutor(2) as pool :
+            pool.submit(seqLister.condenseSeq, [3, 4]).result()
+    seqLister.expandSeq(["1-3"])
+seqLister.disableStats()
+print(outerStats.condenseCalls, outerStats.expandCalls, innerStats.condenseCalls, globalStats.condenseCalls, seqLister._scopedStats.get())
+
+print("")
+print("Testing the condense cache")
+print("")
+print(seqLister.condenseCacheInfo())
+seqLister.enableCondenseCache(maxEntries=2)
+print(seqLister.condenseSeq([1, 2, 3, 5, 7, 9]), seqLister.condenseSeq(["9", 7, 5, 3, 2, 1]))
+print(seqLister.condenseSeqOnes([1, 2, 3, 5, 7, 9]), seqLister.condenseSeq([1, 2, 3, 5, 7, 9], 3))
+result = seqLister.condenseSeq([1, 2, 3])
+result.append("changed")
+badArgs = []
+print(seqLister.condenseSeq([1, 2, "x", 3], nonSeqList=badArgs), badArgs)
+info = seqLister.condenseCacheInfo()
+print(info.hits, info.misses, info.currEntries, info.currBytes > 0)
+print(seqLister.condenseSeq([1, 2, 3, 5, 7, 9, 9]), seqLister.condenseSeq([1, 1, 2, 3, 5, 7, 9]), seqLister.condenseSeq([1, 2, 3, 5, 7, 8, 9]), seqLister.condenseSeq([]))
+seqLister.clearCondenseCache()
+print(seqLister.condenseCacheInfo().currEntries, seqLister.condenseCacheInfo().hits)
+seqLister.enableCondenseCache(maxBytes=100)
+print(seqLister.condenseSeq(range(0, 1000, 2)), seqLister.condenseCacheInfo().currEntries)
+seqLister.disableCondenseCache()
+print(seqLister.condenseCacheInfo())
+
+print("")
+print("Testing expandSeq(order=\"sorted\")")
+print("")
+badArgs = []
+print(seqLister.expandSeq(["0-16x8", "0-16x2"], order="sorted"))
+print(seqLister.expandSeq(["20-10x3", "5-1", "x", "3", "12-14"], badArgs, order="sorted"), badArgs)
+print(seqLister.expandSeq(["1-10", "11-20x3", "-5--3", "2-6x2", "21", "30-25x2"], order="sorted"))
+print(seqLister.expandSeq(["50-60", "1-4", "5-9", "10"], order="sorted"), seqLister.expandSeq([], order="sorted"))
+try :
+    seqLister.expandSeq("1-3", order="random")
+except ValueError as e :
+    print("ValueError:", e)
+print(seqLister.condenseSeq(seqLister.expandSeq(["0-100x2", 51], order="sorted")))
+print(seqLister.condenseSeqOnes(seqLister.expandSeq(["1-5", "7-9x2"], order="sorted"), 3))
+
+print("")
+print("Testing normalizeSeq")
+print("")
+badArgs = []
+print(seqLister.normalizeSeq("1-100, 50-200, 201-300x1"))
+print(seqLister.normalizeSeq(["1-10", "2-20x2"], pad=3, ones=True))
+print(seqLister.normalizeSeq(["0-100x2", 51, "a-b"], nonSeqList=badArgs), badArgs)
+print(seqLister.normalizeSeq(["20-10x3", "-5--1", "0"], pad=2), seqLister.normalizeSeq([]))
+print(seqLister.normalizeSeq("1-10000000, 5000000-20000000x1, 1-20000000x7", pad=4))
+
+print("")
+print("Testing splitSeq")
+print("")
+badArgs = []
+print(seqLister.splitSeq("1001-1100x5", chunkSize=8))
+print(seqLister.splitSeq("1-10 20-22", chunks=3))
+print(seqLister.splitSeq(["1-5", "x", "10-20x2"], chunks=10, pad=3, nonSeqList=badArgs), badArgs)
+print(seqLister.splitSeq(seqLister.FrameSet("0-100x2 51"), chunkSize=20), seqLister.splitSeq([], chunks=4))
+print(seqLister.splitSeq("1-10000000", chunks=4))
+for kwargs in [{}, {"chunkSize" : 5, "chunks" : 2}, {"chunks" : 0}] :
+    try :
+        seqLister.splitSeq("1-10", **kwargs)
+    except ValueError as e :
+        print("ValueError:", e)
+
+print("")
+print("Testing the asyncio functions")
+print("")
+import asyncio
+
+async def asyncTests() :
+    badArgs = []
+    print(await seqLister.expandSeqAsync(["1-5", "x", "3-9x3"], badArgs), badArgs)
+    print(await seqLister.expandSeqAsync(["1-5", "x", "3-9x3"], badArgs, threshold=2, sliceSize=3), badArgs)
+    print(await seqLister.expandSeqAsync(["0-16x8", "0-16x2"], order="sorted", threshold=1, sliceSize=4))
+    print(len(await seqLister.expandSeqAsync(list(range(250000)), sliceSize=1000)))
+    print(await seqLister.expandSeqAsync(("1-3",), badArgs), badArgs, seqLister.expandSeq(("1-3",)))
+    print(await seqLister.expandSeqAsync(range(5), badArgs, threshold=1), badArgs)
+    print(await seqLister.condenseSeqAsync([1, 2, 3, "5", "y"], pad=2, nonSeqList=badArgs), badArgs)
+    print(await seqLister.condenseSeqAsync([1, 2, 3, 5, 7], threshold=2))
+    print(await seqLister.condenseSeqOnesAsync(iter([1, 2, 3, 5, 7]), pad=3))
+    print(await seqLister.condenseSeqAsync(range(0, 300000, 3)))
+    with concurrent.futures.ThreadPoolExecutor(1) as executor :
+        print(await seqLister.condenseSeqAsync([4, 3, 2], threshold=0, executor=executor))
+    rejects = []
+    print([frame async for frame in seqLister.iexpandSeqAsync(["5-1", "a", "3-7"], rejects.append, sliceSize=2)], rejects)
+    try :
+        await seqLister.expandSeqAsync("1-3", order="backwards")
+    except ValueError as e :
+        print("ValueError:", e)
+
+asyncio.run(asyncTests())
+
+print("")
+print("Testing dumps and loads")
+print("")
+badArgs = []
+data = seqLister.dumps(["1001-1240", "1250-1300x2", "z"], badArgs)
+print(data, len(data), badArgs)
+print(repr(seqLister.loads(data)), repr(seqLister.loads(bytearray(data))))
+print(repr(seqLister.loads(seqLister.dumps(seqLister.FrameSet("-1000000000000--5 7 20-10x3")))))
+print(seqLister.dumps([]), repr(seqLister.loads(seqLister.dumps([]))))
+import mmap
+with tempfile.TemporaryFile() as f :
+    f.write(seqLister.dumps("1-10000000x2 20000000"))
+    f.flush()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m :
+        print(repr(seqLister.loads(m)))
+for data in [b"", b"SQLB\x02\x00", b"SQLB\x01\x01\x80", b"SQLB\x01\x00\x00", b"JUNK"] :
+    try :
+        seqLister.loads(data)
+    except ValueError as e :
+        print("ValueError:", e)
@@ -0,0 +1,134 @@
+# Differential test of the optional C speedups (_speedups.c) against
+# the pure python reference code. Run from the tests directory, after
+# building the extension (e.g. "python3 setup.py build_ext --inplace"
+# from the top of the repo, or "pip install ."),
+#
+#     python3 testSpeedups.py [--trials N] [--seed N]
+#
+# It checks that testSeqLister.py gives the same output with and
+# without the speedups, then compares the C and python versions of the
+# parse, expand and condense kernels on random inputs. Exits with
+# status 1 on any difference.
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, srcDir)
+import seqLister
+
+failures = 0
+
+def check(what, arg, fast, reference) :
+    global failures
+    if fast != reference :
+        failures += 1
+        if failures <= 10 :
+            print("MISMATCH in " + what + " for " + repr(arg))
+            print("    C:      " + repr(fast))
+            print("    python: " + repr(reference))
+
+# withoutSpeedups() - Calls func(*args) using only the python code.
+#
+def withoutSpeedups(func, *args) :
+    speedups = seqLister._speedups
+    seqLister._speedups = None
+    try :
+        return func(*args)
+    finally :
+        seqLister._speedups = speedups
+
+def goldenOutput(noSpeedups) :
+    env = dict(os.environ)
+    env["PYTHONPATH"] = srcDir + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("SEQLISTER_NO_SPEEDUPS", None)
+    if noSpeedups :
+        env["SEQLISTER_NO_SPEEDUPS"] = "1"
+    return subprocess.run([sys.executable, "testSeqLister.py"], env=env,
+        stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+
+def randomNumber(rng) :
+    kind = rng.random()
+    if kind < 0.8 :
+        return str(rng.randint(0, 40))
+    if kind < 0.9 :
+        return "0" * rng.randint(1, 3) + str(rng.randint(0, 40))
+    return str(rng.choice([2**62 - 1, 2**62, 2**63, 10**30, 12345678901234]))
+
+def randomToken(rng) :
+    kind = rng.random()
+    if kind < 0.6 :
+        token = rng.choice(["", "-"]) + randomNumber(rng)
+        if rng.random() < 0.7 :
+            token += "-" + rng.choice(["", "-"]) + randomNumber(rng)
+            if rng.random() < 0.5 :
+                token += "x" + rng.choice(["", "-"]) + rng.choice(["0", "1", "2", "3", "7", randomNumber(rng)])
+        return token
+    return "".join(rng.choice("0123456789--xx,a\t\x1c ²٣") for i in range(rng.randint(0, 8)))
+
+def randomSpec(rng) :
+    return rng.choice([" ", ",", ", ", "\t", "\n"]).join(randomToken(rng) for i in range(rng.randint(0, 4)))
+
+def randomFrames(rng) :
+    frames = [rng.randint(-30, 100) for i in range(rng.randint(0, 60))]
+    if rng.random() < 0.3 :
+        frames.extend(range(rng.randint(-50, 0), rng.randint(0, 200), rng.randint(1, 5)))
+    if rng.random() < 0.05 :
+        frames.append(rng.choice([2**62, -2**62, 2**62 - 1, 2**70]))
+    if rng.random() < 0.05 :
+        frames.append(True)
+    rng.shuffle(frames)
+    return frames
+
+def main() :
+    parser = argparse.ArgumentParser(description="Compare the C speedups with the python code.")
+    parser.add_argument("--trials", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if seqLister._speedups is None :
+        print("seqLister._speedups isn't built (or SEQLISTER_NO_SPEEDUPS is set), skipped")
+        return 0
+
+    golden = goldenOutput(False)
+    check("testSeqLister.py", "", golden, goldenOutput(True))
+    with open("testSeqLister.out") as f :
+        check("testSeqLister.py", "testSeqLister.out", golden, f.read())
+
+    rng = random.Random(args.seed)
+    for trial in range(args.trials) :
+        spec = randomSpec(rng)
+        check("parse", spec, seqLister._parseSeqStringUncached(spec),
+            withoutSpeedups(seqLister._parseSeqStringUncached, spec))
+
+        specList = [randomSpec(rng) for i in range(rng.randint(0, 4))] + \
+            [rng.randint(-10, 50) for i in range(rng.randint(0, 3))]
+        frameRanges = list(seqLister._iterFrameRanges(specList, seqLister._ignore))
+        if all(abs(start - end) < 10**5 for start, end, step in frameRanges) :
+            check("expand", specList, seqLister._expandRanges(frameRanges),
+                withoutSpeedups(seqLister._expandRanges, frameRanges))
+
+        frames = randomFrames(rng)
+        pad = rng.choice([1, 1, 1, 2, 4, 0, 70, -3])
+        for condense in (seqLister.condenseSeq, seqLister.condenseSeqOnes) :
+            try :
+                reference = withoutSpeedups(condense, list(frames), pad)
+            except ValueError as e :
+                reference = repr(e)
+            try :
+                fast = condense(list(frames), pad)
+            except ValueError as e :
+                fast = repr(e)
+            check(condense.__name__, (frames, pad), fast, reference)
+
+    if failures :
+        print("FAILED: %d mismatches" % failures)
+        return 1
+    print("ok: %d trials" % args.trials)
+    return 0
+
+if __name__ == "__main__" :
+    sys.exit(main())